@@ -4,19 +4,60 @@ ActiveTrail SDK - Unofficial SDK for ActiveTrail service.
 This package provides a simple, Pythonic interface to the ActiveTrail API.
 """
 
+from importlib import import_module
+
 __version__ = "0.2.2"
 
-from .client import ActiveTrailClient
-from .contacts import ContactsAPI
-from .sms_campaigns import SMSCampaignsAPI
-from .groups import GroupsAPI
-from .base_api import BaseAPI, CrudAPI, NestedResourceAPI, CampaignBaseAPI
 from .exceptions import (
-    ActiveTrailError, 
-    AuthenticationError, 
-    RateLimitError, 
-    ValidationError, 
+    ActiveTrailError,
+    AuthenticationError,
+    RateLimitError,
+    ValidationError,
     NotFoundError,
     ServerError,
     NetworkError
-) 
\ No newline at end of file
+)
+
+# API classes are resolved lazily (PEP 562): importing the package no longer
+# pays for the pydantic DTO modules behind SMSCampaignsAPI until the first
+# attribute access actually needs them.
+_LAZY_IMPORTS = {
+    'ActiveTrailClient': '.client',
+    'ContactsAPI': '.contacts',
+    'SMSCampaignsAPI': '.sms_campaigns',
+    'GroupsAPI': '.groups',
+    'WebhooksAPI': '.webhooks',
+    'BaseAPI': '.base_api',
+    'CrudAPI': '.base_api',
+    'NestedResourceAPI': '.base_api',
+    'CampaignBaseAPI': '.base_api'
+}
+
+__all__ = [
+    'ActiveTrailClient',
+    'ContactsAPI',
+    'SMSCampaignsAPI',
+    'GroupsAPI',
+    'WebhooksAPI',
+    'BaseAPI',
+    'CrudAPI',
+    'NestedResourceAPI',
+    'CampaignBaseAPI',
+    'ActiveTrailError',
+    'AuthenticationError',
+    'RateLimitError',
+    'ValidationError',
+    'NotFoundError',
+    'ServerError',
+    'NetworkError'
+]
+
+
+def __getattr__(name):
+    """Resolve and cache lazily exported API classes on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
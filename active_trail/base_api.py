@@ -41,7 +41,10 @@ class CrudAPI(BaseAPI):
         """
         super().__init__(client)
         self.resource_path = resource_path
-    
+        # Item URLs are built by concatenating onto this prefix instead of
+        # re-evaluating an f-string over resource_path on every call.
+        self._item_prefix = resource_path + "/"
+
     def list(self, limit: int = 100, offset: int = 0, **kwargs) -> Dict[str, Any]:
         """
         Get a list of resources.
@@ -72,8 +75,8 @@ class CrudAPI(BaseAPI):
         Returns:
             Resource data
         """
-        return self.client.get(f"{self.resource_path}/{resource_id}")
-    
+        return self.client.get(self._item_prefix + str(resource_id))
+
     def create(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Create a new resource.
@@ -97,7 +100,7 @@ class CrudAPI(BaseAPI):
         Returns:
             Updated resource data
         """
-        return self.client.put(f"{self.resource_path}/{resource_id}", json=data)
+        return self.client.put(self._item_prefix + str(resource_id), json=data)
     
     def delete(self, resource_id: str) -> Any:
         """
@@ -109,7 +112,7 @@ class CrudAPI(BaseAPI):
         Returns:
             Response data
         """
-        return self.client.delete(f"{self.resource_path}/{resource_id}")
+        return self.client.delete(self._item_prefix + str(resource_id))
 
 
 class NestedResourceAPI(BaseAPI):
@@ -253,7 +256,7 @@ class CampaignBaseAPI(CrudAPI):
             Scheduling confirmation data
         """
         return self.client.post(
-            f"{self.resource_path}/{campaign_id}/schedule", 
+            self._item_prefix + str(campaign_id) + "/schedule",
             json=schedule_data
         )
     
@@ -267,7 +270,7 @@ class CampaignBaseAPI(CrudAPI):
         Returns:
             Response data
         """
-        return self.client.post(f"{self.resource_path}/{campaign_id}/send")
+        return self.client.post(self._item_prefix + str(campaign_id) + "/send")
     
     def get_statistics(self, campaign_id: str) -> Dict[str, Any]:
         """
@@ -279,7 +282,7 @@ class CampaignBaseAPI(CrudAPI):
         Returns:
             Campaign statistics
         """
-        return self.client.get(f"{self.resource_path}/{campaign_id}/statistics")
+        return self.client.get(self._item_prefix + str(campaign_id) + "/statistics")
     
     def clone(self, campaign_id: str, name: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -292,8 +295,9 @@ class CampaignBaseAPI(CrudAPI):
         Returns:
             Cloned campaign data
         """
-        data = {}
-        if name:
-            data["name"] = name
-            
-        return self.client.post(f"{self.resource_path}/{campaign_id}/clone", json=data)
\ No newline at end of file
+        # Build the payload as a conditional literal instead of creating an
+        # empty dict and assigning into it; the endpoint expects a JSON body
+        # even when no name is given.
+        data = {"name": name} if name else {}
+
+        return self.client.post(self._item_prefix + str(campaign_id) + "/clone", json=data)
\ No newline at end of file
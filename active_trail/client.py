@@ -4,10 +4,27 @@ ActiveTrail core client implementation.
 
 import json
 import logging
+import threading
+import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, List, Any, Optional, Union
 from urllib.parse import urljoin
 
+try:
+    import orjson
+    _fast_dumps = orjson.dumps
+    _fast_loads = orjson.loads
+except ImportError:
+    try:
+        import msgspec.json
+        _fast_dumps = msgspec.json.encode
+        _fast_loads = msgspec.json.decode
+    except ImportError:
+        _fast_dumps = None
+        _fast_loads = None
+
 from .exceptions import (
     ActiveTrailError, 
     AuthenticationError, 
@@ -21,13 +38,52 @@ from .exceptions import (
 logger = logging.getLogger(__name__)
 
 
+class _TokenBucket:
+    """
+    Thread-safe token bucket used for client-side request rate limiting.
+
+    Tokens refill continuously at `rate` per second up to a burst capacity of
+    one second's worth; acquire() blocks for exactly the deficit rather than
+    backing off blindly, so throughput stays at the quota boundary.
+    """
+
+    __slots__ = ("rate", "capacity", "tokens", "last", "lock")
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.capacity = rate
+        self.tokens = rate
+        self.last = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available, then consume it."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity,
+                    self.tokens + (now - self.last) * self.rate
+                )
+                self.last = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
 class ActiveTrailClient:
     """
     Main client for the ActiveTrail API.
     
     This client provides synchronous access to the ActiveTrail API,
     following the official API documentation from webapi.mymarketing.co.il/api/docs.
-    
+
+    All API modules route their requests through the client's single pooled
+    requests.Session, so keep-alive connections (and their completed TLS
+    handshakes) are reused across every call made through this client.
+
     Example:
         ```python
         client = ActiveTrailClient(api_key="your_api_key")
@@ -36,15 +92,35 @@ class ActiveTrailClient:
     """
 
     BASE_URL = "https://webapi.mymarketing.co.il/api/"
-    
-    def __init__(self, api_key: str, timeout: int = 30):
+
+    # Connection-pool size for the shared session; sized to cover concurrent
+    # helpers like get_all_campaigns without opening new TCP+TLS connections.
+    POOL_MAXSIZE = 32
+
+    RETRY_POLICY = Retry(
+        total=5,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(["GET", "POST", "PUT", "DELETE"]),
+        respect_retry_after_header=True
+    )
+
+    def __init__(
+        self,
+        api_key: str,
+        timeout: int = 30,
+        rate_limit_rps: Optional[float] = None
+    ):
         """
         Initialize the ActiveTrail client.
-        
+
         Args:
             api_key: The API key for ActiveTrail service
             timeout: Request timeout in seconds
-        
+            rate_limit_rps: Optional client-side request cap in requests per
+                second; when set, requests wait for a token-bucket slot
+                instead of being rejected with 429s at the quota boundary
+
         Example:
             ```python
             client = ActiveTrailClient(api_key="your_api_key", timeout=60)
@@ -52,17 +128,31 @@ class ActiveTrailClient:
         """
         self.api_key = api_key
         self.timeout = timeout
+        self._bucket = _TokenBucket(rate_limit_rps) if rate_limit_rps else None
         self.session = requests.Session()
         self.session.headers.update({
             "Content-Type": "application/json",
             "Accept": "application/json",
             "Authorization": f"{api_key}"
         })
+
+        # Retry transient failures (rate limits and 5xx) at the transport
+        # layer with exponential backoff instead of surfacing them to callers,
+        # and keep a pool of warm connections so sequential and threaded calls
+        # skip the TCP/TLS handshake after the first request.
+        adapter = HTTPAdapter(
+            max_retries=self.RETRY_POLICY,
+            pool_connections=self.POOL_MAXSIZE,
+            pool_maxsize=self.POOL_MAXSIZE
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         
         # Initialize API modules when they are first accessed
         self._contacts = None
         self._sms_campaigns = None
         self._groups = None
+        self._webhooks = None
     
     @property
     def contacts(self):
@@ -88,109 +178,160 @@ class ActiveTrailClient:
             self._groups = GroupsAPI(self)
         return self._groups
     
-    def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Any:
+    @property
+    def webhooks(self):
+        """Lazy-loaded Webhooks API module."""
+        if self._webhooks is None:
+            from .webhooks import WebhooksAPI
+            self._webhooks = WebhooksAPI(self)
+        return self._webhooks
+
+    def close(self) -> None:
+        """Close the underlying session and release pooled connections."""
+        self.session.close()
+
+    def __enter__(self) -> "ActiveTrailClient":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None, timeout: Optional[int] = None) -> Any:
         """
         Make a GET request to the ActiveTrail API.
-        
+
         Args:
             endpoint: API endpoint to call
             params: Query parameters
-            
+            timeout: Per-request timeout override in seconds
+
         Returns:
             Parsed JSON response
-            
+
         Raises:
             ActiveTrailError: On API errors
-            
+
         Example:
             ```python
             data = client.get("contacts", params={"limit": 10})
             ```
         """
-        return self.request("GET", endpoint, params=params)
-    
-    def post(self, endpoint: str, params: Optional[Dict[str, Any]] = None, json: Optional[Dict[str, Any]] = None) -> Any:
+        return self.request("GET", endpoint, params=params, timeout=timeout)
+
+    def post(self, endpoint: str, params: Optional[Dict[str, Any]] = None, json: Optional[Dict[str, Any]] = None, timeout: Optional[int] = None) -> Any:
         """
         Make a POST request to the ActiveTrail API.
-        
+
         Args:
             endpoint: API endpoint to call
             params: Query parameters
             json: JSON payload
-            
+            timeout: Per-request timeout override in seconds
+
         Returns:
             Parsed JSON response
-            
+
         Raises:
             ActiveTrailError: On API errors
-            
+
         Example:
             ```python
             data = client.post("contacts", json={"email": "example@example.com"})
             ```
         """
-        return self.request("POST", endpoint, params=params, data=json)
-    
-    def put(self, endpoint: str, params: Optional[Dict[str, Any]] = None, json: Optional[Dict[str, Any]] = None) -> Any:
+        return self.request("POST", endpoint, params=params, data=json, timeout=timeout)
+
+    def put(self, endpoint: str, params: Optional[Dict[str, Any]] = None, json: Optional[Dict[str, Any]] = None, timeout: Optional[int] = None) -> Any:
         """
         Make a PUT request to the ActiveTrail API.
-        
+
         Args:
             endpoint: API endpoint to call
             params: Query parameters
             json: JSON payload
-            
+            timeout: Per-request timeout override in seconds
+
         Returns:
             Parsed JSON response
-            
+
         Raises:
             ActiveTrailError: On API errors
-            
+
         Example:
             ```python
             data = client.put("contacts/123", json={"first_name": "John"})
             ```
         """
-        return self.request("PUT", endpoint, params=params, data=json)
-    
-    def delete(self, endpoint: str, params: Optional[Dict[str, Any]] = None, json: Optional[Dict[str, Any]] = None) -> Any:
+        return self.request("PUT", endpoint, params=params, data=json, timeout=timeout)
+
+    def delete(self, endpoint: str, params: Optional[Dict[str, Any]] = None, json: Optional[Dict[str, Any]] = None, timeout: Optional[int] = None) -> Any:
         """
         Make a DELETE request to the ActiveTrail API.
-        
+
         Args:
             endpoint: API endpoint to call
             params: Query parameters
             json: JSON payload
-            
+            timeout: Per-request timeout override in seconds
+
         Returns:
             Parsed JSON response
-            
+
         Raises:
             ActiveTrailError: On API errors
-            
+
         Example:
             ```python
             client.delete("contacts/123")
             ```
         """
-        return self.request("DELETE", endpoint, params=params, data=json)
+        return self.request("DELETE", endpoint, params=params, data=json, timeout=timeout)
+
+    def _encode_body(self, data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Build the body keyword arguments for a request.
+
+        When `orjson` (or, failing that, `msgspec`) is installed, payloads are
+        serialized with it instead of the stdlib encoder used by `requests`.
+        Both emit UTF-8 bytes directly, which is significantly faster for
+        large bulk payloads such as multi-contact group imports.
+
+        Pre-serialized payloads (bytes, e.g. from `BaseDTO.to_json_bytes()`)
+        are passed through untouched, so callers that reuse one DTO across
+        many sends pay the serialization cost once.
+
+        Args:
+            data: Request payload, or None for body-less requests
+
+        Returns:
+            Keyword arguments to pass to the session request method
+        """
+        if data is not None:
+            if data.__class__ is bytes:
+                return {"data": data}
+            if _fast_dumps is not None:
+                return {"data": _fast_dumps(data)}
+        return {"json": data}
 
     def request(
-        self, 
-        method: str, 
-        endpoint: str, 
-        params: Optional[Dict[str, Any]] = None, 
-        data: Optional[Dict[str, Any]] = None
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        timeout: Optional[int] = None
     ) -> Any:
         """
         Make a request to the ActiveTrail API.
-        
+
         Args:
             method: HTTP method (GET, POST, PUT, DELETE)
             endpoint: API endpoint to call
             params: URL parameters
             data: Request payload
-            
+            timeout: Per-request timeout override in seconds; falls back to
+                the client-wide timeout when not given
+
         Returns:
             Parsed JSON response
             
@@ -209,18 +350,28 @@ class ActiveTrailClient:
             ```
         """
         url = urljoin(self.BASE_URL, endpoint)
-        
+
         logger.debug(f"Making {method} request to {url}")
-        
+
+        # Client-side rate limiting: wait for a token before sending so we
+        # pace at the quota boundary rather than burning round trips on 429
+        # rejections. Retry-After on the responses that still slip through is
+        # honored by the transport-level RETRY_POLICY.
+        if self._bucket is not None:
+            self._bucket.acquire()
+
+        if timeout is None:
+            timeout = self.timeout
+
         try:
             if method == "GET":
-                response = self.session.get(url, params=params, timeout=self.timeout)
+                response = self.session.get(url, params=params, timeout=timeout)
             elif method == "POST":
-                response = self.session.post(url, params=params, json=data, timeout=self.timeout)
+                response = self.session.post(url, params=params, timeout=timeout, **self._encode_body(data))
             elif method == "PUT":
-                response = self.session.put(url, params=params, json=data, timeout=self.timeout)
+                response = self.session.put(url, params=params, timeout=timeout, **self._encode_body(data))
             elif method == "DELETE":
-                response = self.session.delete(url, params=params, json=data, timeout=self.timeout)
+                response = self.session.delete(url, params=params, timeout=timeout, **self._encode_body(data))
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
             
@@ -228,6 +379,11 @@ class ActiveTrailClient:
             
             # Some endpoints might not return JSON
             if response.content and response.headers.get("Content-Type", "").startswith("application/json"):
+                # Decode with the same fast codec used for request bodies
+                # when one is installed; response.json() goes through the
+                # pure-Python parser.
+                if _fast_loads is not None:
+                    return _fast_loads(response.content)
                 return response.json()
             return response.content
             
@@ -2,16 +2,12 @@
 ActiveTrail Contacts API implementation.
 """
 
-from typing import Dict, Any, Optional, List, Union, cast
+from typing import Dict, Any, Iterator, Optional, List, Union, cast
 from .dto.contacts import (
-    ContactDTO, 
-    ContactListRequestDTO, 
+    ContactDTO,
+    ContactListRequestDTO,
     ContactActivityRequestDTO,
-    ContactActivityDTO,
-    ContactUnsubscribeDTO,
-    ContactMultipleUnsubscribeDTO,
-    ContactResubscribeDTO,
-    ContactMultipleResubscribeDTO
+    ContactActivityDTO
 )
 
 
@@ -63,10 +59,38 @@ class ContactsAPI:
             created_to=created_to,
             only_active=only_active,
             only_bounced=only_bounced
-        ).to_dict()
-            
+        ).to_query_params()
+
         return self.client.get("contacts", params=params)
-    
+
+    def iter_list(self, page_size: int = 100) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all contacts, fetching pages lazily.
+
+        Pages are requested on demand as the iterator is consumed, so peak
+        memory stays bounded by one page and the first contact is available
+        after a single round trip. Stopping early (e.g. breaking out of the
+        loop) never fetches the remaining pages.
+
+        Args:
+            page_size: Number of contacts to request per page (default: 100)
+
+        Returns:
+            Iterator over individual contact dictionaries
+
+        Example:
+            >>> for contact in client.contacts.iter_list(page_size=50):
+            ...     process(contact)
+        """
+        offset = 0
+        while True:
+            page = self.list(limit=page_size, offset=offset)
+            contacts = page.get("contacts", [])
+            yield from contacts
+            if len(contacts) < page_size:
+                return
+            offset += page_size
+
     def get(self, contact_id: str) -> Dict[str, Any]:
         """
         Get information about a specific contact.
@@ -91,13 +115,35 @@ class ContactsAPI:
         Returns:
             Created contact data
         """
-        if isinstance(contact, ContactDTO):
-            contact_data = contact.to_dict()
-        else:
-            contact_data = contact
-            
+        # Exact type check: dicts pass through untouched on the hot path,
+        # anything else is expected to serialize itself.
+        contact_data = contact if contact.__class__ is dict else contact.to_dict()
+
         return self.client.post("contacts", json=contact_data)
-    
+
+    def create_many(
+        self,
+        contacts: List[Union[ContactDTO, Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """
+        Create multiple contacts in a single bulk request.
+
+        One request body carrying all N contacts replaces N round trips,
+        so the per-call serialization and HTTP overhead is paid once.
+
+        Args:
+            contacts: List of contacts to create (as ContactDTO objects or
+                dictionaries)
+
+        Returns:
+            Response data for the bulk operation
+        """
+        payload = [
+            contact if contact.__class__ is dict else contact.to_dict()
+            for contact in contacts
+        ]
+        return self.client.post("contacts/bulk", json={"contacts": payload})
+
     def update(self, contact_id: str, contact: Union[ContactDTO, Dict[str, Any]]) -> Dict[str, Any]:
         """
         Update an existing contact.
@@ -109,11 +155,8 @@ class ContactsAPI:
         Returns:
             Updated contact data
         """
-        if isinstance(contact, ContactDTO):
-            contact_data = contact.to_dict()
-        else:
-            contact_data = contact
-            
+        contact_data = contact if contact.__class__ is dict else contact.to_dict()
+
         return self.client.put(f"contacts/{contact_id}", json=contact_data)
     
     def delete(self, contact_id: str) -> Dict[str, Any]:
@@ -200,8 +243,8 @@ class ContactsAPI:
             activity_type=activity_type,
             from_date=from_date,
             to_date=to_date
-        ).to_dict()
-            
+        ).to_query_params()
+
         return self.client.get(f"contacts/{contact_id}/activities", params=params)
     
     def get_custom_fields(self) -> List[Dict[str, Any]]:
@@ -239,13 +282,12 @@ class ContactsAPI:
         Returns:
             Import results data
         """
-        contact_data = []
-        for contact in contacts:
-            if isinstance(contact, ContactDTO):
-                contact_data.append(contact.to_dict())
-            else:
-                contact_data.append(contact)
-                
+        contact_data = [
+            contact if contact.__class__ is dict else contact.to_dict()
+            for contact in contacts
+        ]
+
+
         import_data = {
             "contacts": contact_data,
             "updateExisting": update_existing
@@ -267,7 +309,9 @@ class ContactsAPI:
         Returns:
             Response data
         """
-        data = ContactUnsubscribeDTO(email=email, reason=reason).to_dict()
+        data = {"email": email}
+        if reason is not None:
+            data["reason"] = reason
         return self.client.post("contacts/unsubscribe", json=data)
     
     def unsubscribe_multiple(self, emails: List[str], reason: Optional[str] = None) -> Dict[str, Any]:
@@ -281,7 +325,9 @@ class ContactsAPI:
         Returns:
             Response data
         """
-        data = ContactMultipleUnsubscribeDTO(emails=emails, reason=reason).to_dict()
+        data = {"emails": emails}
+        if reason is not None:
+            data["reason"] = reason
         return self.client.post("contacts/unsubscribe-multiple", json=data)
     
     def resubscribe(self, email: str) -> Dict[str, Any]:
@@ -294,8 +340,7 @@ class ContactsAPI:
         Returns:
             Response data
         """
-        data = ContactResubscribeDTO(email=email).to_dict()
-        return self.client.post("contacts/resubscribe", json=data)
+        return self.client.post("contacts/resubscribe", json={"email": email})
     
     def resubscribe_multiple(self, emails: List[str]) -> Dict[str, Any]:
         """
@@ -307,5 +352,4 @@ class ContactsAPI:
         Returns:
             Response data
         """
-        data = ContactMultipleResubscribeDTO(emails=emails).to_dict()
-        return self.client.post("contacts/resubscribe-multiple", json=data) 
\ No newline at end of file
+        return self.client.post("contacts/resubscribe-multiple", json={"emails": emails}) 
\ No newline at end of file
@@ -2,7 +2,7 @@
 Base Data Transfer Object for ActiveTrail API.
 """
 
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, field, fields
 from typing import Any, Dict, Optional, ClassVar, List, Type, TypeVar, cast
 import json
 import re
@@ -10,6 +10,104 @@ from datetime import datetime
 
 T = TypeVar('T', bound='BaseDTO')
 
+try:
+    import orjson
+    _dumps_bytes = orjson.dumps
+except ImportError:
+    def _dumps_bytes(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+# Field names and optional-field sets per DTO class, computed once on first
+# use. Looking these up via __dataclass_fields__ on every to_dict() call
+# would redo the same work per serialization.
+_FIELDS_CACHE: Dict[type, tuple] = {}
+_OPTIONAL_CACHE: Dict[type, frozenset] = {}
+
+
+def _field_names(cls: type) -> tuple:
+    """Return the cached tuple of dataclass field names for `cls`."""
+    names = _FIELDS_CACHE.get(cls)
+    if names is None:
+        names = tuple(f.name for f in fields(cls))
+        _FIELDS_CACHE[cls] = names
+    return names
+
+
+def _optional_names(cls: type) -> frozenset:
+    """Return the cached frozenset of optional field names for `cls`."""
+    names = _OPTIONAL_CACHE.get(cls)
+    if names is None:
+        names = frozenset(cls._optional_fields)
+        _OPTIONAL_CACHE[cls] = names
+    return names
+
+
+def _convert(value: Any, field_name: str) -> Any:
+    """
+    Convert one non-None field value to its API representation.
+
+    Recurses only where needed (nested DTOs, datetimes, containers of them);
+    primitives pass straight through.
+    """
+    if value.__class__ in (str, int, float, bool):
+        return value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, BaseDTO):
+        return value.to_dict()
+    if isinstance(value, list):
+        if value and all(isinstance(item, BaseDTO) for item in value):
+            return [item.to_dict() for item in value]
+        if value and all(isinstance(item, datetime) for item in value):
+            return [item.isoformat() for item in value]
+        # Keep other lists as is, assuming they are serializable
+        return value
+    if isinstance(value, dict):
+        processed_dict = {}
+        for k, v in value.items():
+            if isinstance(v, datetime):
+                processed_dict[k] = v.isoformat()
+            elif isinstance(v, BaseDTO):
+                processed_dict[k] = v.to_dict()
+            elif hasattr(v, '__dict__'):
+                # Handle objects with __dict__ that aren't BaseDTO
+                processed_dict[k] = vars(v)
+            else:
+                processed_dict[k] = v
+        return processed_dict
+    if hasattr(value, '__dict__'):
+        # Handle custom objects that aren't BaseDTO by using vars()
+        return vars(value)
+    # Try to convert to string as a last resort
+    try:
+        return str(value)
+    except:
+        raise ValueError(f"Value for field '{field_name}' is not JSON serializable: {value}")
+
+
+def _compile_query_params(cls: type):
+    """
+    Generate a specialized query-parameter builder for a DTO class.
+
+    The generated function mirrors to_dict() for flat request DTOs — optional
+    fields are skipped when None, field names are mapped to their API names —
+    but as a fixed sequence of attribute loads with no per-call reflection.
+    """
+    mapping = cls._api_field_mapping
+    optional = set(cls._optional_fields)
+    lines = ["def to_query_params(self):", "    d = {}"]
+    for name in _field_names(cls):
+        api_name = mapping.get(name, name)
+        if name in optional:
+            lines.append(f"    if self.{name} is not None:")
+            lines.append(f"        d[{api_name!r}] = self.{name}")
+        else:
+            lines.append(f"    d[{api_name!r}] = self.{name}")
+    lines.append("    return d")
+    namespace: Dict[str, Any] = {}
+    exec("\n".join(lines), {}, namespace)
+    return namespace["to_query_params"]
+
 @dataclass
 class BaseDTO:
     """
@@ -21,6 +119,11 @@ class BaseDTO:
     - JSON serialization and deserialization
     """
     
+    # No fields of its own; keeping the base slotted lets subclasses declared
+    # with @dataclass(slots=True) drop the per-instance __dict__ entirely.
+    # The single slot holds the lazily computed to_json_bytes() result.
+    __slots__ = ("_json_bytes_cache",)
+
     # Class variables for field mappings and optional fields
     _api_field_mapping: ClassVar[Dict[str, str]] = {}
     _optional_fields: ClassVar[List[str]] = []
@@ -32,65 +135,43 @@ class BaseDTO:
         Returns:
             Dict[str, Any]: Dictionary representation suitable for API requests
         """
-        # Get all non-None fields
+        # Read fields directly off the instance via the cached field-name
+        # tuple instead of asdict(), which walks and deep-copies the whole
+        # object graph on every call. Per-class mapping and optional-field
+        # lookups are hoisted out of the loop; _convert handles the value
+        # conversion ladder.
+        cls = self.__class__
+        mapping = cls._api_field_mapping
+        optional = _optional_names(cls)
         result = {}
-        data = asdict(self)
-        
-        # Apply field mappings and filter out None values
-        for field_name, value in data.items():
-            if value is None and field_name in self._optional_fields:
+        for field_name in _field_names(cls):
+            value = getattr(self, field_name)
+            if value is None:
+                if field_name not in optional:
+                    result[mapping.get(field_name, field_name)] = None
                 continue
-                
-            # Apply field mapping if it exists
-            api_field_name = self._api_field_mapping.get(field_name, field_name)
-            
-            # Handle different types of values
-            if isinstance(value, datetime):
-                # Convert datetime to ISO format string
-                result[api_field_name] = value.isoformat()
-            elif isinstance(value, BaseDTO):
-                # Convert nested DTO to dictionary
-                result[api_field_name] = value.to_dict()
-            elif isinstance(value, list):
-                # Process list items
-                if value and all(isinstance(item, BaseDTO) for item in value):
-                    # Convert list of DTOs to list of dictionaries
-                    result[api_field_name] = [item.to_dict() for item in value]
-                elif value and all(isinstance(item, datetime) for item in value):
-                    # Convert list of datetimes to list of ISO format strings
-                    result[api_field_name] = [item.isoformat() for item in value]
-                else:
-                    # Keep other lists as is, assuming they are serializable
-                    result[api_field_name] = value
-            elif isinstance(value, dict):
-                # Process dictionary values recursively
-                processed_dict = {}
-                for k, v in value.items():
-                    if isinstance(v, datetime):
-                        processed_dict[k] = v.isoformat()
-                    elif isinstance(v, BaseDTO):
-                        processed_dict[k] = v.to_dict()
-                    elif hasattr(v, '__dict__'):
-                        # Handle objects with __dict__ that aren't BaseDTO
-                        processed_dict[k] = vars(v)
-                    else:
-                        processed_dict[k] = v
-                result[api_field_name] = processed_dict
-            elif hasattr(value, '__dict__') and not isinstance(value, (str, int, float, bool)):
-                # Handle custom objects that aren't BaseDTO by using vars()
-                result[api_field_name] = vars(value)
-            elif isinstance(value, (str, int, float, bool)) or value is None:
-                # Keep primitive types as is
-                result[api_field_name] = value
-            else:
-                # Try to convert to string as a last resort
-                try:
-                    result[api_field_name] = str(value)
-                except:
-                    raise ValueError(f"Value for field '{field_name}' is not JSON serializable: {value}")
-            
+            result[mapping.get(field_name, field_name)] = _convert(value, field_name)
         return result
     
+    def to_query_params(self) -> Dict[str, Any]:
+        """
+        Convert the DTO to a flat query-parameter dictionary.
+
+        Intended for flat request DTOs (pagination/filter parameters); the
+        builder is compiled once per class and cached, so repeated calls in
+        pagination loops avoid the reflective to_dict() path.
+
+        Returns:
+            Dict[str, Any]: Query parameters with API field names, optional
+            fields omitted when None
+        """
+        cls = self.__class__
+        func = cls.__dict__.get("_compiled_query_params")
+        if func is None:
+            func = _compile_query_params(cls)
+            cls._compiled_query_params = func
+        return func(self)
+
     @classmethod
     def from_dict(cls: Type[T], data: Dict[str, Any]) -> T:
         """
@@ -114,6 +195,25 @@ class BaseDTO:
             
         return cls(**kwargs)
     
+    def to_json_bytes(self) -> bytes:
+        """
+        Serialize the DTO to JSON bytes, caching the result on the instance.
+
+        Repeated sends of the same DTO (bulk fan-outs, retries) reuse the
+        bytes from the first call instead of re-walking the object graph, so
+        treat the DTO as immutable once it has been serialized — later field
+        mutations are not reflected in the cached payload.
+
+        Returns:
+            bytes: UTF-8 JSON representation of the DTO
+        """
+        try:
+            return self._json_bytes_cache
+        except AttributeError:
+            encoded = _dumps_bytes(self.to_dict())
+            self._json_bytes_cache = encoded
+            return encoded
+
     def to_json(self) -> str:
         """
         Convert the DTO to JSON.
@@ -7,7 +7,7 @@ from typing import Dict, List, Optional, ClassVar
 from .base import BaseDTO
 
 
-@dataclass
+@dataclass(slots=True)
 class CampaignListRequestDTO(BaseDTO):
     """
     Request parameters for listing campaigns.
@@ -30,7 +30,7 @@ class CampaignListRequestDTO(BaseDTO):
     ]
 
 
-@dataclass
+@dataclass(slots=True)
 class CampaignDuplicateRequestDTO(BaseDTO):
     """
     Request parameters for duplicating a campaign.
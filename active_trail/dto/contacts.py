@@ -8,7 +8,7 @@ from datetime import datetime
 from .base import BaseDTO
 
 
-@dataclass
+@dataclass(slots=True)
 class ContactDTO(BaseDTO):
     """
     Contact Data Transfer Object for creating and retrieving contacts.
@@ -44,7 +44,7 @@ class ContactDTO(BaseDTO):
     ]
 
 
-@dataclass
+@dataclass(slots=True)
 class ContactListRequestDTO(BaseDTO):
     """
     Request parameters for listing contacts.
@@ -71,7 +71,7 @@ class ContactListRequestDTO(BaseDTO):
     ]
 
 
-@dataclass
+@dataclass(slots=True)
 class ContactActivityDTO(BaseDTO):
     """
     Contact activity data transfer object.
@@ -101,7 +101,7 @@ class ContactActivityDTO(BaseDTO):
     }
 
 
-@dataclass
+@dataclass(slots=True)
 class ContactActivityRequestDTO(BaseDTO):
     """
     Request parameters for retrieving contact activities.
@@ -125,7 +125,7 @@ class ContactActivityRequestDTO(BaseDTO):
     ]
 
 
-@dataclass
+@dataclass(slots=True)
 class ContactUnsubscribeDTO(BaseDTO):
     """
     Data transfer object for unsubscribing a contact.
@@ -136,7 +136,7 @@ class ContactUnsubscribeDTO(BaseDTO):
     _optional_fields: ClassVar[List[str]] = ['reason']
 
 
-@dataclass
+@dataclass(slots=True)
 class ContactMultipleUnsubscribeDTO(BaseDTO):
     """
     Data transfer object for unsubscribing multiple contacts.
@@ -147,7 +147,7 @@ class ContactMultipleUnsubscribeDTO(BaseDTO):
     _optional_fields: ClassVar[List[str]] = ['reason']
 
 
-@dataclass
+@dataclass(slots=True)
 class ContactResubscribeDTO(BaseDTO):
     """
     Data transfer object for resubscribing a contact.
@@ -155,7 +155,7 @@ class ContactResubscribeDTO(BaseDTO):
     email: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ContactMultipleResubscribeDTO(BaseDTO):
     """
     Data transfer object for resubscribing multiple contacts.
@@ -8,7 +8,7 @@ from datetime import datetime
 from .base import BaseDTO
 
 
-@dataclass
+@dataclass(slots=True)
 class GroupDTO(BaseDTO):
     """
     Group data transfer object for creation and updates.
@@ -24,7 +24,7 @@ class GroupDTO(BaseDTO):
     _optional_fields: ClassVar[List[str]] = ['description', 'group_id']
 
 
-@dataclass
+@dataclass(slots=True)
 class GroupResponseDTO(BaseDTO):
     """
     Group response data transfer object.
@@ -43,7 +43,7 @@ class GroupResponseDTO(BaseDTO):
     }
 
 
-@dataclass
+@dataclass(slots=True)
 class GroupListRequestDTO(BaseDTO):
     """
     Request parameters for listing groups.
@@ -54,7 +54,7 @@ class GroupListRequestDTO(BaseDTO):
     _optional_fields: ClassVar[List[str]] = ['limit', 'offset']
 
 
-@dataclass
+@dataclass(slots=True)
 class GroupContactDTO(BaseDTO):
     """
     Group contact data transfer object.
@@ -62,7 +62,7 @@ class GroupContactDTO(BaseDTO):
     sms: str
 
 
-@dataclass
+@dataclass(slots=True)
 class GroupContactsRequestDTO(BaseDTO):
     """
     Request parameters for retrieving group contacts.
@@ -80,7 +80,20 @@ class GroupContactsRequestDTO(BaseDTO):
 
 class GroupAddContactDTO:
     """DTO for adding a contact to a group."""
-    
+
+    __slots__ = (
+        "group_id",
+        "sms",
+        "first_name",
+        "last_name",
+        "status",
+        "sms_status",
+        "campaign_id",
+        "subscribe_ip",
+        "double_optin",
+        "is_deleted"
+    )
+
     def __init__(
         self,
         group_id: int,
@@ -146,7 +159,7 @@ class GroupAddContactDTO:
         return data
 
 
-@dataclass
+@dataclass(slots=True)
 class GroupAddMultipleContactsDTO(BaseDTO):
     """
     Data transfer object for adding multiple contacts to a group.
@@ -159,7 +172,7 @@ class GroupAddMultipleContactsDTO(BaseDTO):
     }
 
 
-@dataclass
+@dataclass(slots=True)
 class GroupRemoveContactDTO(BaseDTO):
     """
     Data transfer object for removing a contact from a group.
@@ -172,7 +185,7 @@ class GroupRemoveContactDTO(BaseDTO):
     }
 
 
-@dataclass
+@dataclass(slots=True)
 class GroupRemoveMultipleContactsDTO(BaseDTO):
     """
     Data transfer object for removing multiple contacts from a group.
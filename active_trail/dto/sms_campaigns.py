@@ -11,30 +11,73 @@ logger = logging.getLogger(__name__)
 
 class BaseDTO(BaseModel):
     """Base DTO class with helper methods for API field mapping."""
-    
+
     class Config:
         arbitrary_types_allowed = True
-    
+
+    @staticmethod
+    def _apply_field_mapping(data: Dict[str, Any]) -> Dict[str, Any]:
+        """Rename dumped field names to API field names (no-op by default)."""
+        return data
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        """Compile the class's field-mapping renames and to_dict at class creation.
+
+        Instead of iterating `_api_field_mapping` reflectively on every
+        `to_dict()` call, generate a specialized function with one fixed
+        rename statement per mapped field, plus a `to_dict` whose body
+        explicitly names every field with its API key baked in, and attach
+        both to the class.
+        """
+        super().__pydantic_init_subclass__(**kwargs)
+        mapping = {
+            field_name: api_field_name
+            for field_name, api_field_name in getattr(cls, "_api_field_mapping", {}).items()
+            if field_name != api_field_name
+        }
+        namespace: Dict[str, Any] = {}
+        if mapping:
+            lines = ["def _apply_field_mapping(data):"]
+            for field_name, api_field_name in mapping.items():
+                lines.append(f"    if {field_name!r} in data:")
+                lines.append(f"        data[{api_field_name!r}] = data.pop({field_name!r})")
+            lines.append("    return data")
+            exec("\n".join(lines), {}, namespace)
+            cls._apply_field_mapping = staticmethod(namespace["_apply_field_mapping"])
+
+        # Specialized to_dict: one straight-line statement group per field,
+        # reading the attribute directly with the mapped API key inlined, so
+        # serialization skips the generic model_dump walk and rename pass.
+        lines = [
+            "def to_dict(self):",
+            '    """Convert the DTO to a dictionary with proper API field mappings."""',
+            "    data = {}"
+        ]
+        for field_name in cls.model_fields:
+            api_name = mapping.get(field_name, field_name)
+            lines.append(f"    v = self.{field_name}")
+            lines.append("    if v is not None:")
+            lines.append("        if isinstance(v, BaseDTO):")
+            lines.append("            v = v.model_dump(exclude_none=True)")
+            lines.append("        elif v.__class__ is list and v and isinstance(v[0], BaseDTO):")
+            lines.append("            v = [item.model_dump(exclude_none=True) for item in v]")
+            lines.append(f"        data[{api_name!r}] = v")
+        lines.append("    return data")
+        exec("\n".join(lines), {"BaseDTO": BaseDTO}, namespace)
+        cls.to_dict = namespace["to_dict"]
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert the DTO to a dictionary with proper API field mappings."""
-        data = self.model_dump(exclude_none=True)
-        
-        # Apply field mappings if available
-        api_field_mapping = getattr(self, "_api_field_mapping", {})
-        
-        if api_field_mapping:
-            # Map field names to API field names
-            for field_name, api_field_name in api_field_mapping.items():
-                if field_name in data:
-                    data[api_field_name] = data.pop(field_name)
-        
+        data = self._apply_field_mapping(self.model_dump(exclude_none=True))
+
         # Handle nested DTOs
         for key, value in list(data.items()):
             if isinstance(value, BaseDTO):
                 data[key] = value.to_dict()
             elif isinstance(value, list) and value and isinstance(value[0], BaseDTO):
                 data[key] = [item.to_dict() for item in value]
-        
+
         return data
 
 
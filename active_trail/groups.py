@@ -2,7 +2,9 @@
 ActiveTrail Groups API implementation.
 """
 
-from typing import Dict, Any, Optional, List, Union
+import logging
+from itertools import islice
+from typing import Dict, Any, Iterable, Iterator, Optional, List, Union
 from .base_api import CrudAPI
 from .dto.groups import (
     GroupDTO,
@@ -16,6 +18,21 @@ from .dto.groups import (
     GroupRemoveMultipleContactsDTO
 )
 
+logger = logging.getLogger(__name__)
+
+
+def _chunks(iterable: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """
+    Yield successive lists of up to `size` items from `iterable`.
+
+    Args:
+        iterable: Source of items to batch
+        size: Maximum number of items per chunk
+    """
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
 
 class GroupsAPI(CrudAPI):
     """Groups API handling for ActiveTrail."""
@@ -51,7 +68,7 @@ class GroupsAPI(CrudAPI):
             offset=offset
         )
         
-        params = request.to_dict()
+        params = request.to_query_params()
         if search:
             params["search"] = search
             
@@ -81,11 +98,8 @@ class GroupsAPI(CrudAPI):
         Returns:
             Created group data
         """
-        if isinstance(group, GroupDTO):
-            group_data = group.to_dict()
-        else:
-            group_data = group
-            
+        group_data = group if group.__class__ is dict else group.to_dict()
+
         return self.client.post(self.resource_path, json=group_data)
     
     def update(
@@ -104,11 +118,8 @@ class GroupsAPI(CrudAPI):
         Returns:
             Updated group data
         """
-        if isinstance(group, GroupDTO):
-            group_data = group.to_dict()
-        else:
-            group_data = group
-            
+        group_data = group if group.__class__ is dict else group.to_dict()
+
         return self.client.put(f"{self.resource_path}/{group_id}", json=group_data)
     
     def delete(self, group_id: int) -> Dict[str, Any]:
@@ -148,7 +159,7 @@ class GroupsAPI(CrudAPI):
         
         return self.client.get(
             f"{self.resource_path}/{group_id}/contacts",
-            params=request.to_dict()
+            params=request.to_query_params()
         )
     
     def add_contact(
@@ -200,6 +211,26 @@ class GroupsAPI(CrudAPI):
             json=request.to_dict()
         )
     
+    def add_contacts(self, group_id: int, emails: List[str]) -> Dict[str, Any]:
+        """
+        Add multiple contacts to a group in a single bulk request.
+
+        Collapses N per-contact round trips into one request whose body
+        carries all N items, amortizing serialization and HTTP overhead
+        across the batch.
+
+        Args:
+            group_id: The ID of the group
+            emails: Email addresses of the contacts to add
+
+        Returns:
+            Response data for the bulk operation
+        """
+        return self.client.post(
+            f"{self.resource_path}/{group_id}/contacts/bulk",
+            json={"contacts": [{"email": email} for email in emails]}
+        )
+
     def remove_contact_from_group(self, group_id: int, contact_id: int) -> Dict[str, Any]:
         """
         Remove a contact from a group.
@@ -221,63 +252,102 @@ class GroupsAPI(CrudAPI):
     def add_multiple_contacts_to_group_external(
         self,
         group_id: int,
-        contacts: List[dict]
-    ) -> bool:
+        contacts: Iterable[dict],
+        chunk_size: int = 1000
+    ) -> List[Any]:
         """
-        Add multiple contacts to a group in a single operation.
+        Add multiple contacts to a group, posting them in chunks.
+
+        Contacts are transformed lazily and posted `chunk_size` at a time, so
+        peak memory stays bounded by the chunk size rather than the full
+        contact list.
+
+        Args:
+            group_id: The ID of the group
+            contacts: Iterable of contact dictionaries with id and first_name keys
+            chunk_size: Maximum number of contacts per request (default: 1000)
+
+        Returns:
+            List of per-chunk response data
         """
-        contacts_to_add = [self._get_contact_dict_to_add(contact) for contact in contacts ]        
-        return self.client.post(f"external/group/{group_id}", json=contacts_to_add)
+        transformed = (self._get_contact_dict_to_add(contact) for contact in contacts)
+        # Hoist the URL and the bound post method out of the loop; each chunk
+        # then costs a LOAD_FAST instead of attribute chains through self.
+        url = f"external/group/{group_id}"
+        post = self.client.post
+        return [
+            post(url, json=chunk)
+            for chunk in _chunks(transformed, chunk_size)
+        ]
             
     def add_multiple_contacts(
         self,
-        group_id: int, 
+        group_id: int,
         contacts: List[dict],
         status: str = "active"
-    ) -> bool:
+    ) -> Dict[str, List[Any]]:
         """
         Add multiple contacts to a group in a single operation.
-        
+
+        Each contact is added independently; a failure on one contact does not
+        abort the rest of the batch, so callers only need to retry the
+        contacts listed under "failed".
+
         Args:
             group_id: The ID of the group
             contacts: List of contact dictionaries with sms, first_name, and last_name keys
             status: The status of the contacts in the group (default: "active")
-            
+
         Returns:
-            True if all contacts were added successfully, False otherwise
+            Dictionary with "succeeded" (list of contacts added) and "failed"
+            (list of {"contact": ..., "error": ...} entries)
         """
-        try:
-            for contact in contacts:
-                self.add_contact(
-                    group_id=group_id, 
+        succeeded = []
+        failed = []
+        # Bind the bound method once; avoids an attribute lookup per contact
+        # in very large batches.
+        add_contact = self.add_contact
+        for contact in contacts:
+            try:
+                add_contact(
+                    group_id=group_id,
                     sms=contact["sms"],
                     first_name=contact.get("first_name"),
                     last_name=contact.get("last_name"),
                     status=status
                 )
-            return True
-        except Exception as e:
-            print(f"Error adding contact: {contact} to group: {group_id}: {e}")
-            return False
-    
-    def remove_multiple_contacts(self, group_id: int, contacts: List[dict]) -> bool:
+                succeeded.append(contact)
+            except Exception as e:
+                logger.exception("Error adding contact %s to group %s", contact, group_id)
+                failed.append({"contact": contact, "error": str(e)})
+        return {"succeeded": succeeded, "failed": failed}
+
+    def remove_multiple_contacts(self, group_id: int, contacts: List[dict]) -> Dict[str, List[Any]]:
         """
         Remove multiple contacts from a group in a single operation.
-        
+
+        Each contact is removed independently; a failure on one contact does
+        not abort the rest of the batch.
+
         Args:
             group_id: The ID of the group
-            sms_numbers: List of SMS numbers to remove from the group
-            
+            contacts: List of contact dictionaries with an "id" key
+
         Returns:
-            Response data
+            Dictionary with "succeeded" (list of contacts removed) and
+            "failed" (list of {"contact": ..., "error": ...} entries)
         """
-        try:
-            for contact in contacts:
-                self.remove_contact_from_group(group_id, contact["id"])
-            return True
-        except Exception as e:
-            print(f"Error removing contact: {contact} from group: {group_id}: {e}")
-            return False
+        succeeded = []
+        failed = []
+        remove_contact = self.remove_contact_from_group
+        for contact in contacts:
+            try:
+                remove_contact(group_id, contact["id"])
+                succeeded.append(contact)
+            except Exception as e:
+                logger.exception("Error removing contact %s from group %s", contact, group_id)
+                failed.append({"contact": contact, "error": str(e)})
+        return {"succeeded": succeeded, "failed": failed}
 
     def get_members(
         self,
@@ -2,28 +2,122 @@
 ActiveTrail SMS Campaigns API implementation.
 """
 
-from typing import Dict, Any, Optional, List, Union, Type, TypeVar
+from typing import Any, Callable, Dict, Optional, List, Tuple, Union, Type, TypeVar
 from datetime import datetime
+import functools
 import logging
+import math
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pydantic import ValidationError
 from .base_api import CampaignBaseAPI
+# Import only the DTO symbols this module actually references; the response
+# and sub-object DTOs stay importable from .dto.sms_campaigns for callers
+# that want them, without widening this module's import-time surface.
 from .dto.sms_campaigns import (
     BaseDTO,
     SMSCampaignDTO,
-    ApiSmsCampaignInfoCampaign,
-    ApiSmsCampaignInfoCampaignList,
-    SMSCampaignSchedulingDTO,
-    ApiSmsCampaignSegment,
-    ApiSMSMobileDTO,
     ApiSMSCampaignDetailsDTO,
     ApiSmsCampaignSchedulingDTO,
-    SMSOperationalMessageDTO,
-    SMSOperationalMessageResponseDTO
+    SMSOperationalMessageDTO
 )
 
 logger = logging.getLogger(__name__)
 T = TypeVar('T', bound=BaseDTO)
 
+# Path fragments interned once at module load; URL construction then
+# concatenates interned strings instead of re-evaluating f-strings per call.
+_PATH_CAMPAIGN = sys.intern("/Campaign")
+_PATH_OPERATIONAL_MESSAGE = sys.intern("/OperationalMessage")
+_PATH_ESTIMATE = sys.intern("/estimate")
+
+# Fully-static default payloads built once at module load. Only read, never
+# mutated: validation constructs a fresh model from them on every send.
+_SEND_NOW_SCHEDULING = {"send_now": True}
+
+# Conversion handlers memoized by (input type, model class, trust): once a
+# combination has been dispatched, later calls skip the branch chain and go
+# straight to the right converter with a single dict lookup.
+_DISPATCH: Dict[Tuple[type, type, bool], Callable[[Any], Dict[str, Any]]] = {}
+
+
+@functools.lru_cache(maxsize=None)
+def _trusted_builder(model_class: Type[BaseDTO]) -> Callable[[BaseDTO], Dict[str, Any]]:
+    """
+    Build (and cache per class) a flat-dict converter for trusted DTOs.
+
+    The returned closure reads fields straight off the instance instead of
+    running the full model_dump serializer walk, skipping None values and
+    applying the class's API field mapping, so output matches to_dict().
+
+    Args:
+        model_class: The DTO class to generate a converter for
+    """
+    field_names = tuple(model_class.model_fields)
+    apply_mapping = model_class._apply_field_mapping
+
+    def build(obj: BaseDTO) -> Dict[str, Any]:
+        data = {}
+        for name in field_names:
+            value = getattr(obj, name)
+            if value is None:
+                continue
+            if isinstance(value, BaseDTO):
+                value = value.model_dump(exclude_none=True)
+            elif value.__class__ is list and value and isinstance(value[0], BaseDTO):
+                value = [item.model_dump(exclude_none=True) for item in value]
+            data[name] = value
+        return apply_mapping(data)
+
+    return build
+
+
+class _OperationalMessageBatcher:
+    """
+    Accumulates recipients for one operational SMS and sends them in batches.
+
+    Recipients added one at a time are grouped into multi-recipient payloads,
+    so N add() calls cost one HTTP round-trip per `max_batch` recipients
+    instead of one per recipient. Flushes automatically when the batch is
+    full and on clean context-manager exit.
+    """
+
+    def __init__(self, api, details, scheduling, max_batch: int = 100):
+        self._api = api
+        self._details = details
+        self._scheduling = scheduling
+        self._max_batch = max_batch
+        self._pending: List[Dict[str, Any]] = []
+        self.responses: List[Dict[str, Any]] = []
+
+    def add(self, phone_number: str) -> None:
+        """Queue a recipient; sends automatically when the batch is full."""
+        self._pending.append({"phone_number": phone_number})
+        if len(self._pending) >= self._max_batch:
+            self.flush()
+
+    def flush(self) -> Optional[Dict[str, Any]]:
+        """Send any queued recipients as a single operational message."""
+        if not self._pending:
+            return None
+        mobiles, self._pending = self._pending, []
+        response = self._api.send_operational_message({
+            "details": self._details,
+            "scheduling": self._scheduling,
+            "mobiles": mobiles
+        })
+        self.responses.append(response)
+        return response
+
+    def __enter__(self) -> "_OperationalMessageBatcher":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.flush()
+
+
 class SMSCampaignsAPI(CampaignBaseAPI):
     """SMS Campaigns API handling for ActiveTrail."""
 
@@ -43,32 +137,145 @@ class SMSCampaignsAPI(CampaignBaseAPI):
             ```
         """
         super().__init__(client, "smscampaign")
+
+        # Precompute the endpoint prefixes once; every call then does a single
+        # string concatenation instead of re-evaluating an f-string over
+        # self.resource_path.
+        self._campaign_url = self.resource_path + _PATH_CAMPAIGN
+        self._campaign_item_prefix = self._campaign_url + "/"
+        self._op_msg_url = self.resource_path + _PATH_OPERATIONAL_MESSAGE
+        self._op_msg_item_prefix = self._op_msg_url + "/"
+
+        # Report URL templates indexed by the get_contacts flag; %-formatting
+        # against a stored template keeps the branch and f-string off the
+        # monitoring hot path.
+        self._report_urls = (
+            "smscampaignreport/%d",
+            "smscampaignreport/%d/Delivered"
+        )
+
+        # Read endpoints get a tighter timeout than the client-wide default:
+        # list/get calls in monitoring loops should fail fast and lean on the
+        # transport-level retry policy, while writes keep the longer default.
+        self._read_timeout = 10
+
+        # Paginated fetches pass the same from/to datetimes page after page;
+        # remember their isoformat strings instead of re-formatting each call.
+        self._iso_cache: Dict[datetime, str] = {}
+
+        # Opt-in TTL cache for read endpoints; disabled until enable_cache()
+        # is called. Keys are (method name, request arguments) tuples, values
+        # are (timestamp, response) pairs.
+        self._cache: Dict[Tuple, Tuple[float, Any]] = {}
+        self._cache_ttl: float = 0
+
         logger.debug("SMS Campaigns API initialized")
+
+    def enable_cache(self, ttl_seconds: float = 30) -> None:
+        """
+        Enable in-process caching of read endpoints.
+
+        Repeated reads of the same campaign or campaign list within the TTL
+        are served from memory instead of paying a full HTTP round-trip. Any
+        write through this API clears the cache.
+
+        Args:
+            ttl_seconds: How long a cached response stays fresh (default: 30)
+        """
+        self._cache_ttl = ttl_seconds
+
+    def disable_cache(self) -> None:
+        """Disable response caching and drop any cached entries."""
+        self._cache_ttl = 0
+        self._cache.clear()
+
+    def _cached_get(self, key: Tuple, fetch: Callable[[], Any]) -> Any:
+        """
+        Return a cached response for `key` or fetch and cache a fresh one.
+
+        Args:
+            key: Cache key identifying the read call and its arguments
+            fetch: Zero-argument callable performing the actual request
+        """
+        if self._cache_ttl <= 0:
+            return fetch()
+        entry = self._cache.get(key)
+        now = time.monotonic()
+        if entry is not None and now - entry[0] < self._cache_ttl:
+            return entry[1]
+        value = fetch()
+        self._cache[key] = (now, value)
+        return value
     
-    def _validate_and_convert(self, data: Union[Dict[str, Any], T], model_class: Type[T]) -> Dict[str, Any]:
+    def _isoformat_cached(self, value: datetime) -> str:
+        """
+        Return value.isoformat(), memoized across calls.
+
+        Args:
+            value: The datetime to format
+        """
+        cache = self._iso_cache
+        iso = cache.get(value)
+        if iso is None:
+            if len(cache) >= 64:
+                cache.clear()
+            iso = value.isoformat()
+            cache[value] = iso
+        return iso
+
+    def _validate_and_convert(self, data: Union[Dict[str, Any], T], model_class: Type[T], trust: bool = False, trust_dict: bool = False) -> Dict[str, Any]:
         """
         Validate the input data against the specified model class and convert it to a dictionary.
-        
+
         Args:
             data: Input data (either a dictionary or a Pydantic model)
             model_class: The Pydantic model class to validate against
-            
+            trust: If true, convert instances of model_class with the cached
+                per-class builder instead of the full serializer walk; the
+                DTO was validated when it was constructed
+            trust_dict: If true, build the model from dict input with
+                model_construct instead of validating it; only for payloads
+                whose shape the caller already guarantees
+
         Returns:
             Validated data as a dictionary ready to be sent to the API
         """
-        try:
-            if isinstance(data, dict):
-                # Validate against the model
-                validated_data = model_class(**data)
-                return validated_data.to_dict()
-            elif isinstance(data, model_class):
-                # Already a valid model, just convert to dict
-                return data.to_dict()
+        key = (data.__class__, model_class, trust, trust_dict)
+        handler = _DISPATCH.get(key)
+        if handler is not None:
+            return handler(data)
+
+        if data.__class__ is dict:
+            if trust_dict:
+                # model_construct assigns the fields directly without
+                # entering pydantic-core, so known-good payloads skip the
+                # per-field coercion entirely and only pay for to_dict().
+                def handler(d, _construct=model_class.model_construct):
+                    return _construct(**d).to_dict()
             else:
-                raise TypeError(f"Expected dict or {model_class.__name__}, got {type(data).__name__}")
-        except ValidationError as e:
-            logger.error(f"Validation error for {model_class.__name__}: {e}")
-            raise
+                # Only the validating branch needs the exception handler;
+                # the already-a-model paths below never raise ValidationError.
+                def handler(d, _validate=model_class.model_validate, _name=model_class.__name__):
+                    # model_validate feeds the dict straight to the cached
+                    # core validator instead of unpacking it through **kwargs.
+                    try:
+                        return _validate(d).to_dict()
+                    except ValidationError as e:
+                        logger.error("Validation error for %s: %s", _name, e)
+                        raise
+        elif trust and isinstance(data, model_class):
+            handler = _trusted_builder(model_class)
+        elif getattr(data, 'to_dict', None) is not None:
+            # Duck-typed probe instead of isinstance: anything exposing
+            # to_dict (our DTOs or user-defined equivalents) is already
+            # validated, so skip the __instancecheck__ dispatch.
+            def handler(obj):
+                return obj.to_dict()
+        else:
+            raise TypeError(f"Expected dict or {model_class.__name__}, got {type(data).__name__}")
+
+        _DISPATCH[key] = handler
+        return handler(data)
     
     def get_campaigns(
         self,
@@ -120,36 +327,75 @@ class SMSCampaignsAPI(CampaignBaseAPI):
                 print(f"ID: {campaign['id']}, Name: {campaign['name']}, Status: {campaign['status_name']}")
             ```
         """
-        logger.info(f"Getting SMS campaigns from {from_date} to {to_date} with filter_type={filter_type}")
+        logger.info("Getting SMS campaigns from %s to %s with filter_type=%s", from_date, to_date, filter_type)
         
+        # Build the params mapping in one comprehension over a literal tuple
+        # of candidate pairs; unset filters collapse to None and are dropped,
+        # so the dict is allocated and filled in a single pass.
         params = {
-            'IsIncludeNotSent': is_include_not_sent
+            key: value
+            for key, value in (
+                ('IsIncludeNotSent', is_include_not_sent),
+                ('FromDate', self._isoformat_cached(from_date) if from_date else None),
+                ('ToDate', self._isoformat_cached(to_date) if to_date else None),
+                ('SearchTerm', search_term or None),
+                ('FilterType', filter_type),
+                ('Page', page or None),
+                ('Limit', limit or None)
+            )
+            if value is not None
         }
-        
-        if from_date:
-            params['FromDate'] = from_date.isoformat()
-        
-        if to_date:
-            params['ToDate'] = to_date.isoformat()
-        
-        if search_term:
-            params['SearchTerm'] = search_term
-        
-        if filter_type is not None:
-            params['FilterType'] = filter_type
-        
-        if page:
-            params['Page'] = page
-        
-        if limit:
-            params['Limit'] = limit
-        
-        logger.debug(f"Request parameters: {params}")
-        
-        response = self.client.get(f"{self.resource_path}/Campaign", params=params)
-        logger.debug(f"Retrieved {response.get('total_items', 0)} campaigns")
+
+        logger.debug("Request parameters: %s", params)
+        
+        cache_key = ("get_campaigns", tuple(sorted(params.items())))
+        response = self._cached_get(
+            cache_key,
+            lambda: self.client.get(self._campaign_url, params=params, timeout=self._read_timeout)
+        )
+        logger.debug("Retrieved %s campaigns", response.get('total_items', 0))
         return response
     
+    def get_all_campaigns(
+        self,
+        page_size: int = 100,
+        max_workers: int = 8,
+        **filters: Any
+    ) -> Dict[str, Any]:
+        """
+        Get every SMS campaign, fetching pages concurrently.
+
+        The first page is fetched to learn the total count; any remaining
+        pages are then requested in parallel on a thread pool, so total
+        latency approaches one page round-trip instead of one per page. The
+        shared client session keeps connections warm across threads.
+
+        Args:
+            page_size: Number of campaigns per page request (1-100)
+            max_workers: Maximum concurrent page requests (default: 8)
+            **filters: Additional filters forwarded to get_campaigns
+                       (is_include_not_sent, from_date, to_date, etc.)
+
+        Returns:
+            Dictionary with all campaigns under 'sms_campaign' and the
+            'total_items' count
+        """
+        first_page = self.get_campaigns(page=1, limit=page_size, **filters)
+        campaigns = list(first_page.get('sms_campaign', []))
+        total_items = first_page.get('total_items', len(campaigns))
+
+        total_pages = math.ceil(total_items / page_size) if page_size else 1
+        if total_pages > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                pages = executor.map(
+                    lambda page: self.get_campaigns(page=page, limit=page_size, **filters),
+                    range(2, total_pages + 1)
+                )
+                for page_response in pages:
+                    campaigns.extend(page_response.get('sms_campaign', []))
+
+        return {'sms_campaign': campaigns, 'total_items': total_items}
+
     def get_campaign(self, campaign_id: int) -> Dict[str, Any]:
         """
         Get details of a specific SMS campaign by its ID.
@@ -174,16 +420,19 @@ class SMSCampaignsAPI(CampaignBaseAPI):
             print(f"Total Sent: {campaign['total_sent']}")
             ```
         """
-        logger.info(f"Getting SMS campaign with ID {campaign_id}")
+        logger.info("Getting SMS campaign with ID %s", campaign_id)
         
-        response = self.client.get(f"{self.resource_path}/Campaign/{campaign_id}")
-        logger.debug(f"Retrieved campaign: {response.get('name')}")
+        response = self._cached_get(
+            ("get_campaign", campaign_id),
+            lambda: self.client.get(self._campaign_item_prefix + str(campaign_id), timeout=self._read_timeout)
+        )
+        logger.debug("Retrieved campaign: %s", response.get('name'))
         return response
     
-    def create(self, campaign: Union[Dict[str, Any], SMSCampaignDTO]) -> Dict[str, Any]:
+    def create(self, campaign: Union[Dict[str, Any], SMSCampaignDTO], trusted: bool = False) -> Dict[str, Any]:
         """
         Create and return a new SMS campaign.
-        
+
         Args:
             campaign: SMSCampaignDTO object or dictionary with campaign data
                 Required fields: 
@@ -199,7 +448,10 @@ class SMSCampaignsAPI(CampaignBaseAPI):
                   - can_unsubscribe: If true, adds unsubscription link
                   - is_link_tracking: Whether links are tracked
                   - sms_sending_profile_id: Alternative to from_name
-                
+            trusted: If true, skip validation of dict input and build the
+                payload with model_construct; only for campaign dicts whose
+                shape the caller already guarantees
+
         Returns:
             Created SMS campaign data
             
@@ -278,16 +530,19 @@ class SMSCampaignsAPI(CampaignBaseAPI):
         else:
             campaign_name = getattr(campaign, 'name', 'unnamed')
             
-        logger.info(f"Creating new SMS campaign: {campaign_name}")
-        
-        campaign_data = self._validate_and_convert(campaign, SMSCampaignDTO)
-        logger.debug(f"Validated campaign data: {campaign_data}")
-        
-        response = self.client.post(f"{self.resource_path}/Campaign", json=campaign_data)
-        logger.info(f"Created SMS campaign with ID: {response.get('id')}")
+        logger.info("Creating new SMS campaign: %s", campaign_name)
+
+        campaign_data = self._validate_and_convert(campaign, SMSCampaignDTO, trust=True, trust_dict=trusted)
+        # Guarded: even lazy %s formatting would stringify the whole payload.
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Validated campaign data: %s", campaign_data)
+        
+        self._cache.clear()
+        response = self.client.post(self._campaign_url, json=campaign_data)
+        logger.info("Created SMS campaign with ID: %s", response.get('id'))
         return response
     
-    def update(self, campaign: Union[Dict[str, Any], SMSCampaignDTO]) -> Dict[str, Any]:
+    def update(self, campaign: Union[Dict[str, Any], SMSCampaignDTO], trusted: bool = False) -> Dict[str, Any]:
         """
         Update an existing SMS campaign (whether it was sent or not).
         
@@ -306,7 +561,9 @@ class SMSCampaignsAPI(CampaignBaseAPI):
                   - from_name: Sender name
                   - can_unsubscribe: Whether unsubscription link is added
                   - is_link_tracking: Whether links are tracked
-                
+            trusted: If true, skip validation of dict input and build the
+                payload with model_construct
+
         Returns:
             Updated SMS campaign data
             
@@ -359,18 +616,20 @@ class SMSCampaignsAPI(CampaignBaseAPI):
             client.sms_campaigns.update(updated_campaign_dict)
             ```
         """
-        campaign_data = self._validate_and_convert(campaign, SMSCampaignDTO)
-        
+        campaign_data = self._validate_and_convert(campaign, SMSCampaignDTO, trust=True, trust_dict=trusted)
+
         campaign_id = campaign_data.get('id')
         if not campaign_id:
             logger.error("No campaign ID provided for update operation")
             raise ValueError("Campaign ID is required for updates")
             
-        logger.info(f"Updating SMS campaign with ID: {campaign_id}")
-        logger.debug(f"Update data: {campaign_data}")
+        logger.info("Updating SMS campaign with ID: %s", campaign_id)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Update data: %s", campaign_data)
         
-        response = self.client.put(f"{self.resource_path}/Campaign/{campaign_id}", json=campaign_data)
-        logger.info(f"Successfully updated SMS campaign with ID: {campaign_id}")
+        self._cache.clear()
+        response = self.client.put(self._campaign_item_prefix + str(campaign_id), json=campaign_data)
+        logger.info("Successfully updated SMS campaign with ID: %s", campaign_id)
         return response
     
     def get_estimate(self, campaign_id: int) -> int:
@@ -392,15 +651,37 @@ class SMSCampaignsAPI(CampaignBaseAPI):
             estimate = client.sms_campaigns.get_estimate(campaign_id)
             print(f"Estimated number of messages: {estimate}")
             ```        """
-        logger.info(f"Getting estimate for SMS campaign with ID: {campaign_id}")
+        logger.info("Getting estimate for SMS campaign with ID: %s", campaign_id)
         
-        response = self.client.get(f"{self.resource_path}/Campaign/{campaign_id}/estimate")
-        logger.debug(f"Estimate for campaign {campaign_id}: {response}")
+        response = self.client.get(self._campaign_item_prefix + str(campaign_id) + _PATH_ESTIMATE, timeout=self._read_timeout)
+        logger.debug("Estimate for campaign %s: %s", campaign_id, response)
         return response
         
+    def get_report(self, campaign_id: int, get_contacts: bool = False) -> Dict[str, Any]:
+        """
+        Get the report for a sent SMS campaign.
+
+        Args:
+            campaign_id: SMS campaign ID
+            get_contacts: If true, also return the delivered contacts
+
+        Returns:
+            SMS campaign report data
+
+        Example:
+            ```python
+            # Get campaign report with delivered contacts
+            report = client.sms_campaigns.get_report(123, get_contacts=True)
+            ```
+        """
+        logger.info("Getting report for SMS campaign with ID: %s", campaign_id)
+
+        return self.client.get(self._report_urls[get_contacts] % campaign_id, timeout=self._read_timeout)
+
     def send_operational_message(
-        self, 
-        message: Union[Dict[str, Any], SMSOperationalMessageDTO]
+        self,
+        message: Union[Dict[str, Any], SMSOperationalMessageDTO],
+        trusted: bool = False
     ) -> Dict[str, Any]:
         """
         Send an operational SMS message to specific mobile numbers.
@@ -417,7 +698,9 @@ class SMSCampaignsAPI(CampaignBaseAPI):
                       Can be a dictionary or ApiSmsCampaignSchedulingDTO object
                     - mobiles: List of mobile phone numbers to receive the message
                       Can be a list of dictionaries or ApiSMSMobileDTO objects
-                
+            trusted: If true, skip validation of dict input and build the
+                payload with model_construct
+
         Returns:
             Created SMS operational message data
             
@@ -483,18 +766,95 @@ class SMSCampaignsAPI(CampaignBaseAPI):
             response = client.sms_campaigns.send_operational_message(message_dict)
             ```
         """
-        message_data = self._validate_and_convert(message, SMSOperationalMessageDTO)
-        
-        message_name = (message_data.get('details', {}) or {}).get('name', 'unnamed')
-        logger.info(f"Sending operational SMS message: {message_name}")
-        
-        num_recipients = len(message_data.get('mobiles', []))
-        logger.debug(f"Sending to {num_recipients} recipients")
+        message_data = self._validate_and_convert(message, SMSOperationalMessageDTO, trust=True, trust_dict=trusted)
+
+        details = message_data.get('details')
+        message_name = details.get('name', 'unnamed') if details.__class__ is dict else 'unnamed'
+        logger.info("Sending operational SMS message: %s", message_name)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Sending to %s recipients", len(message_data.get('mobiles', [])))
         
-        response = self.client.post(f"{self.resource_path}/OperationalMessage", json=message_data)
-        logger.info(f"Sent operational SMS message with ID: {response.get('id')}")
+        self._cache.clear()
+        response = self.client.post(self._op_msg_url, json=message_data)
+        logger.info("Sent operational SMS message with ID: %s", response.get('id'))
         return response
     
+    def send_operational_messages(
+        self,
+        messages: List[Union[Dict[str, Any], SMSOperationalMessageDTO]],
+        max_workers: int = 8
+    ) -> List[Dict[str, Any]]:
+        """
+        Send several operational SMS messages, posting them concurrently.
+
+        All payloads are validated up front, then posted in parallel on a
+        thread pool over the client's shared connection pool, so total
+        latency approaches one round-trip instead of one per message.
+        Responses are returned in the same order as the input.
+
+        Args:
+            messages: Message dictionaries or SMSOperationalMessageDTO objects
+            max_workers: Maximum concurrent sends (default: 8)
+
+        Returns:
+            List of created SMS operational message data, in input order
+
+        Example:
+            ```python
+            responses = client.sms_campaigns.send_operational_messages([
+                {"details": {...}, "scheduling": {...}, "mobiles": [...]},
+                {"details": {...}, "scheduling": {...}, "mobiles": [...]}
+            ])
+            ```
+        """
+        payloads = [
+            self._validate_and_convert(message, SMSOperationalMessageDTO, trust=True)
+            for message in messages
+        ]
+        logger.info("Sending %s operational SMS messages", len(payloads))
+
+        self._cache.clear()
+        post = self.client.post
+        url = self._op_msg_url
+        if len(payloads) <= 1 or max_workers <= 1:
+            return [post(url, json=payload) for payload in payloads]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda payload: post(url, json=payload), payloads))
+
+    def batch_operational_message(
+        self,
+        details: Union[Dict[str, Any], ApiSMSCampaignDetailsDTO],
+        scheduling: Optional[Union[Dict[str, Any], ApiSmsCampaignSchedulingDTO]] = None,
+        max_batch: int = 100
+    ) -> _OperationalMessageBatcher:
+        """
+        Build a batcher that collects recipients for one operational message.
+
+        Callers that loop over phone numbers one at a time would otherwise pay
+        an HTTP round-trip per recipient; the batcher groups them into
+        multi-recipient sends of up to `max_batch` numbers.
+
+        Args:
+            details: Message details (name, content, etc.) shared by the batch
+            scheduling: Scheduling information (default: send immediately)
+            max_batch: Maximum recipients per send (default: 100)
+
+        Returns:
+            A context manager with add(phone_number) that flushes on exit
+
+        Example:
+            ```python
+            details = {"name": "Reminder", "content": "...", "from_name": "MyApp"}
+            with client.sms_campaigns.batch_operational_message(details) as batch:
+                for phone in phone_numbers:
+                    batch.add(phone)
+            ```
+        """
+        if scheduling is None:
+            scheduling = _SEND_NOW_SCHEDULING
+        return _OperationalMessageBatcher(self, details, scheduling, max_batch)
+
     def get_operational_message(self, message_id: int) -> Dict[str, Any]:
         """
         Get information about a specific SMS operational message.
@@ -512,24 +872,30 @@ class SMSCampaignsAPI(CampaignBaseAPI):
             print(f"Message content: {message['content']}")
             ```
         """
-        logger.info(f"Getting operational SMS message with ID: {message_id}")
+        logger.info("Getting operational SMS message with ID: %s", message_id)
         
-        response = self.client.get(f"{self.resource_path}/OperationalMessage/{message_id}")
-        logger.debug(f"Retrieved operational message: {response.get('name')}")
+        response = self._cached_get(
+            ("get_operational_message", message_id),
+            lambda: self.client.get(self._op_msg_item_prefix + str(message_id), timeout=self._read_timeout)
+        )
+        logger.debug("Retrieved operational message: %s", response.get('name'))
         return response
     
     def update_operational_message(
         self,
         message_id: int,
-        message: Union[Dict[str, Any], SMSOperationalMessageDTO]
+        message: Union[Dict[str, Any], SMSOperationalMessageDTO],
+        trusted: bool = False
     ) -> Dict[str, Any]:
         """
         Update an existing SMS operational message that has not been sent yet.
-        
+
         Args:
             message_id: The ID of the SMS operational message to update
             message: SMSOperationalMessageDTO object or dictionary with updated message data
-                
+            trusted: If true, skip validation of dict input and build the
+                payload with model_construct
+
         Returns:
             Updated SMS operational message data
             
@@ -589,12 +955,14 @@ class SMSCampaignsAPI(CampaignBaseAPI):
             result = client.sms_campaigns.update_operational_message(123, message_dict)
             ```
         """
-        message_data = self._validate_and_convert(message, SMSOperationalMessageDTO)
-        
-        message_name = (message_data.get('details', {}) or {}).get('name', 'unnamed')
-        logger.info(f"Updating operational SMS message with ID {message_id}: {message_name}")
+        message_data = self._validate_and_convert(message, SMSOperationalMessageDTO, trust=True, trust_dict=trusted)
+
+        details = message_data.get('details')
+        message_name = details.get('name', 'unnamed') if details.__class__ is dict else 'unnamed'
+        logger.info("Updating operational SMS message with ID %s: %s", message_id, message_name)
         
-        response = self.client.put(f"{self.resource_path}/OperationalMessage/{message_id}", json=message_data)
-        logger.info(f"Successfully updated operational SMS message with ID: {message_id}")
+        self._cache.clear()
+        response = self.client.put(self._op_msg_item_prefix + str(message_id), json=message_data)
+        logger.info("Successfully updated operational SMS message with ID: %s", message_id)
         return response 
 
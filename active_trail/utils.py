@@ -3,9 +3,21 @@ Utility functions for the ActiveTrail SDK.
 """
 
 import logging
-from typing import Dict, Any, Optional
+import string
+from typing import Dict, Any, Iterable, List, Optional
 import re
 
+# Validation pattern compiled once at module load; the compiled object
+# skips re's per-call cache lookup on hot validation paths.
+_IL_PHONE_RE = re.compile(r'^(\+972|0)([5][0-9]{8})$')
+
+# Character classes for the manual email scan, precomputed as frozensets so
+# membership checks run as C-level set operations.
+_LOCAL_OK = frozenset(string.ascii_letters + string.digits + '._%+-')
+_DOMAIN_OK = frozenset(string.ascii_letters + string.digits + '.-')
+_ALPHA = frozenset(string.ascii_letters)
+
+
 def configure_logging(
     level: int = logging.INFO,
     format_string: Optional[str] = None
@@ -36,8 +48,34 @@ def validate_email(email: str) -> bool:
     Returns:
         True if the email format is valid, False otherwise
     """
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email))
+    # Manual scan instead of a regex: every step is a C-level str/frozenset
+    # operation, which is considerably cheaper per call on bulk imports.
+    at = email.rfind('@')
+    if at < 1:
+        return False
+    domain = email[at + 1:]
+    dot = domain.rfind('.')
+    if dot < 1 or len(domain) - dot - 1 < 2:
+        return False
+    return (
+        _LOCAL_OK.issuperset(email[:at])
+        and _DOMAIN_OK.issuperset(domain[:dot])
+        and _ALPHA.issuperset(domain[dot + 1:])
+    )
+
+
+def validate_emails_bulk(emails: Iterable[str]) -> List[bool]:
+    """
+    Validate many email addresses in one pass.
+
+    Args:
+        emails: Iterable of email addresses to validate
+
+    Returns:
+        List of validation results in input order
+    """
+    is_valid = validate_email
+    return [is_valid(email) for email in emails]
 
 
 def validate_israeli_phone_number(phone: str) -> bool:
@@ -47,8 +85,7 @@ def validate_israeli_phone_number(phone: str) -> bool:
     Args:
         phone: Phone number to validate
     """
-    pattern = r'^(\+972|0)([5][0-9]{8})$'
-    return bool(re.match(pattern, phone))
+    return _IL_PHONE_RE.match(phone) is not None
 
 def prepare_contact_payload(
     email: str,
@@ -76,20 +113,76 @@ def prepare_contact_payload(
     if phone and not validate_israeli_phone_number(phone):
         raise ValueError(f"Invalid Israeli phone number format: {phone}")
     
-    payload = {
-        "email": email
-    }
-    
-    if first_name:
-        payload["first_name"] = first_name
-        
-    if last_name:
-        payload["last_name"] = last_name
-        
-    if phone:
-        payload["phone"] = phone
-    
+    payload = {"email": email}
+    for key, value in (
+        ("first_name", first_name),
+        ("last_name", last_name),
+        ("phone", phone)
+    ):
+        if value:
+            payload[key] = value
+
     if custom_fields:
+        if not isinstance(custom_fields, dict):
+            raise TypeError(
+                f"custom_fields must be a dict, got {type(custom_fields).__name__}"
+            )
         payload["custom_fields"] = custom_fields
-        
-    return payload 
\ No newline at end of file
+
+    return payload
+
+
+def prepare_contact_payloads_bulk(contacts: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Create standardized contact payloads for a batch of contacts.
+
+    Equivalent to calling prepare_contact_payload per contact, but with the
+    validators bound to locals once and the result list preallocated to its
+    final size, which is noticeably cheaper across large imports.
+
+    Args:
+        contacts: Iterable of contact dictionaries with an "email" key and
+            optional first_name, last_name, phone, and custom_fields keys
+
+    Returns:
+        List of formatted contact payloads for the API
+
+    Raises:
+        ValueError: If any contact has an invalid email or phone number
+    """
+    is_valid_email = validate_email
+    is_valid_phone = validate_israeli_phone_number
+    if contacts.__class__ is not list:
+        contacts = list(contacts)
+    # Preallocate and fill by index; no geometric list growth on big batches.
+    payloads: List[Dict[str, Any]] = [None] * len(contacts)
+
+    for index, contact in enumerate(contacts):
+        email = contact["email"]
+        if not is_valid_email(email):
+            raise ValueError(f"Invalid email format: {email}")
+
+        phone = contact.get("phone")
+        if phone and not is_valid_phone(phone):
+            raise ValueError(f"Invalid Israeli phone number format: {phone}")
+
+        payload = {"email": email}
+
+        first_name = contact.get("first_name")
+        if first_name:
+            payload["first_name"] = first_name
+
+        last_name = contact.get("last_name")
+        if last_name:
+            payload["last_name"] = last_name
+
+        if phone:
+            payload["phone"] = phone
+
+        custom_fields = contact.get("custom_fields")
+        if custom_fields:
+            payload["custom_fields"] = custom_fields
+
+        payloads[index] = payload
+
+    return payloads
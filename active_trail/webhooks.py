@@ -0,0 +1,135 @@
+"""
+ActiveTrail Webhooks API implementation.
+"""
+
+import logging
+from typing import Dict, Any, Optional, List
+from .base_api import BaseAPI
+
+logger = logging.getLogger(__name__)
+
+
+class WebhooksAPI(BaseAPI):
+    """Webhooks API handling for ActiveTrail."""
+
+    def __init__(self, client):
+        """
+        Initialize the Webhooks API.
+
+        Args:
+            client: The ActiveTrail client instance
+        """
+        super().__init__(client)
+        self.resource_path = "webhooks"
+        self._item_prefix = self.resource_path + "/"
+        # Bind the client's request dispatcher once; every method then makes
+        # a single local attribute access instead of the self.client.request
+        # chain on each call.
+        self._request = client.request
+
+    def list(
+        self,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Get a list of registered webhooks.
+
+        Args:
+            limit: Maximum number of webhooks to retrieve
+            offset: Offset for pagination
+
+        Returns:
+            Dictionary containing webhooks data
+        """
+        params = {
+            key: value
+            for key, value in (('limit', limit), ('offset', offset))
+            if value is not None
+        }
+
+        return self._request("GET", self.resource_path, params=params)
+
+    def get(self, webhook_id: int) -> Dict[str, Any]:
+        """
+        Get information about a specific webhook.
+
+        Args:
+            webhook_id: The ID of the webhook to retrieve
+
+        Returns:
+            Webhook data
+        """
+        return self._request("GET", self._item_prefix + str(webhook_id))
+
+    def create(
+        self,
+        url: str,
+        events: Optional[List[str]] = None,
+        is_active: Optional[bool] = None
+    ) -> Dict[str, Any]:
+        """
+        Register a new webhook.
+
+        Args:
+            url: The URL that will receive webhook notifications
+            events: Event names the webhook subscribes to
+            is_active: Whether the webhook starts enabled
+
+        Returns:
+            Created webhook data
+        """
+        data = {
+            key: value
+            for key, value in (
+                ('url', url),
+                ('events', events),
+                ('is_active', is_active)
+            )
+            if value is not None
+        }
+
+        return self._request("POST", self.resource_path, data=data)
+
+    def update(
+        self,
+        webhook_id: int,
+        url: Optional[str] = None,
+        events: Optional[List[str]] = None,
+        is_active: Optional[bool] = None
+    ) -> Dict[str, Any]:
+        """
+        Update an existing webhook.
+
+        Args:
+            webhook_id: The ID of the webhook to update
+            url: New notification URL
+            events: New event subscription list
+            is_active: Enable or disable the webhook
+
+        Returns:
+            Updated webhook data
+        """
+        data = {
+            key: value
+            for key, value in (
+                ('url', url),
+                ('events', events),
+                ('is_active', is_active)
+            )
+            if value is not None
+        }
+
+        return self._request("PUT", self._item_prefix + str(webhook_id), data=data)
+
+    def delete(self, webhook_id: int) -> Dict[str, Any]:
+        """
+        Delete a webhook.
+
+        Args:
+            webhook_id: The ID of the webhook to delete
+
+        Returns:
+            Response data
+        """
+        return self._request("DELETE", self._item_prefix + str(webhook_id))
@@ -6,35 +6,48 @@ that can be run individually or all together.
 """
 
 import os
+import contextlib
+import functools
 import logging
+import logging.handlers
 import datetime
 import argparse
 import sys
-from typing import Optional, Dict, List, Any
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Callable, Mapping, Optional, Dict, List, Any
 
 from active_trail import ActiveTrailClient
-from active_trail.dto.sms_campaigns import ApiSmsCampaignSegment
 from active_trail.utils import configure_logging
 from active_trail.exceptions import ActiveTrailError, ValidationError, NotFoundError
-from active_trail.dto import (
-    ContactDTO,
-    SMSCampaignDTO,
-    GroupDTO,
-    SMSCampaignSchedulingDTO
-)
 
+# DTO modules are imported inside the example functions that need them, so
+# running a single example (e.g. --examples contacts) doesn't pay the import
+# cost of every DTO module at startup.
 
+# All user-visible output goes through this logger; main() wires it to a
+# memory-buffered stdout handler so concurrent examples emit batched writes
+# instead of one locked, flushed write() per line.
+logger = logging.getLogger("active_trail.examples")
+
+
+@functools.lru_cache(maxsize=1)
 def get_client() -> Optional[ActiveTrailClient]:
     """
     Get the ActiveTrail client instance.
-    
+
+    Memoized: repeated calls return the same instance, so the environment
+    read and client construction happen once per process. The client owns a
+    single pooled keep-alive requests.Session, so every example call made
+    through it reuses warm TCP/TLS connections.
+
     Returns:
         ActiveTrailClient: The client instance or None if API key is not set.
     """
     # Get API key from environment variable
     api_key = os.environ.get("ACTIVETRAIL_API_KEY")
     if not api_key:
-        print("Error: ACTIVETRAIL_API_KEY environment variable is required")
+        logger.info("Error: ACTIVETRAIL_API_KEY environment variable is required")
         return None
     
     # Initialize the client
@@ -52,12 +65,12 @@ def example_get_contacts(client: ActiveTrailClient) -> bool:
         bool: True if successful, False otherwise.
     """
     try:
-        print("\n=== Getting contacts ===")
+        logger.info("\n=== Getting contacts ===")
         contacts = client.contacts.list(limit=5)
-        print(f"Found {len(contacts.get('contacts', []))} contacts")
+        logger.info(f"Found {len(contacts.get('contacts', []))} contacts")
         return True
     except ActiveTrailError as e:
-        print(f"Error getting contacts: {e}")
+        logger.info(f"Error getting contacts: {e}")
         return False
 
 
@@ -72,7 +85,9 @@ def example_create_contact(client: ActiveTrailClient) -> bool:
         bool: True if successful, False otherwise.
     """
     try:
-        print("\n=== Creating a contact ===")
+        logger.info("\n=== Creating a contact ===")
+        from active_trail.dto import ContactDTO
+
         # Create contact using DTO
         contact = ContactDTO(
             email=f"example_{datetime.datetime.now().timestamp()}@example.com",
@@ -81,10 +96,10 @@ def example_create_contact(client: ActiveTrailClient) -> bool:
             phone="1234567890"
         )
         new_contact = client.contacts.create(contact)
-        print(f"Created contact: {new_contact.get('id')}")
+        logger.info(f"Created contact: {new_contact.get('id')}")
         return True
     except ActiveTrailError as e:
-        print(f"Error creating contact: {e}")
+        logger.info(f"Error creating contact: {e}")
         return False
 
 
@@ -99,7 +114,7 @@ def example_send_operational_email(client: ActiveTrailClient) -> bool:
         bool: True if successful, False otherwise.
     """
     try:
-        print("\n=== Sending an operational email ===")
+        logger.info("\n=== Sending an operational email ===")
         # Create sender using DTO
         sender = EmailMessageSenderDTO(
             name="Test Sender",
@@ -127,10 +142,10 @@ def example_send_operational_email(client: ActiveTrailClient) -> bool:
             track_clicks=email.track_clicks
         )
         
-        print(f"Email sent: {email_result}")
+        logger.info(f"Email sent: {email_result}")
         return True
     except ActiveTrailError as e:
-        print(f"Error sending operational email: {e}")
+        logger.info(f"Error sending operational email: {e}")
         return False
 
 
@@ -145,7 +160,7 @@ def example_send_operational_sms(client: ActiveTrailClient) -> bool:
         bool: True if successful, False otherwise.
     """
     try:
-        print("\n=== Sending an operational SMS ===")
+        logger.info("\n=== Sending an operational SMS ===")
         # Create SMS message using DTO
         sms = SMSMessageDTO(
             message="Hello from ActiveTrail SDK!",
@@ -160,10 +175,10 @@ def example_send_operational_sms(client: ActiveTrailClient) -> bool:
             sender_id=sms.sender_id
         )
         
-        print(f"SMS sent: {sms_result}")
+        logger.info(f"SMS sent: {sms_result}")
         return True
     except ActiveTrailError as e:
-        print(f"Error sending operational SMS: {e}")
+        logger.info(f"Error sending operational SMS: {e}")
         return False
 
 
@@ -178,16 +193,20 @@ def example_create_and_schedule_email_campaign(client: ActiveTrailClient) -> boo
         bool: True if successful, False otherwise.
     """
     try:
-        print("\n=== Creating an email campaign ===")
+        logger.info("\n=== Creating an email campaign ===")
         # Create sender using DTO
         sender = EmailCampaignSenderDTO(
             name="Test Sender",
             email="sender@example.com"
         )
         
+        # One datetime.now() per run: the name stamp and the schedule share
+        # the same base time, keeping generated identifiers consistent.
+        now = datetime.datetime.now()
+
         # Create campaign using DTO
         campaign = EmailCampaignDTO(
-            name=f"Test Campaign {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            name=f"Test Campaign {now.strftime('%Y-%m-%d %H:%M:%S')}",
             subject="Test Email Campaign",
             html_content="<p>This is a test email campaign</p>",
             sender=sender,
@@ -196,27 +215,27 @@ def example_create_and_schedule_email_campaign(client: ActiveTrailClient) -> boo
         
         campaign_result = client.email_campaigns.create(campaign)
         campaign_id = campaign_result.get("id")
-        print(f"Created campaign: {campaign_id}")
+        logger.info(f"Created campaign: {campaign_id}")
         
         # Schedule the campaign
-        print("\n=== Scheduling the campaign ===")
-        tomorrow = datetime.datetime.now() + datetime.timedelta(days=1)
+        logger.info("\n=== Scheduling the campaign ===")
+        tomorrow = now + datetime.timedelta(days=1)
         scheduled_time = tomorrow.isoformat()
         
         schedule_result = client.email_campaigns.schedule(campaign_id, scheduled_time)
-        print(f"Scheduled campaign: {schedule_result}")
+        logger.info(f"Scheduled campaign: {schedule_result}")
         
         # Get campaign statistics (would normally be done after sending)
         try:
-            print("\n=== Getting campaign statistics ===")
+            logger.info("\n=== Getting campaign statistics ===")
             stats = client.email_campaigns.get_statistics(campaign_id)
-            print(f"Campaign stats: {stats}")
+            logger.info(f"Campaign stats: {stats}")
         except NotFoundError:
-            print("Campaign statistics not available yet (campaign not sent)")
+            logger.info("Campaign statistics not available yet (campaign not sent)")
         
         return True
     except ActiveTrailError as e:
-        print(f"Error working with email campaign: {e}")
+        logger.info(f"Error working with email campaign: {e}")
         return False
 
 
@@ -231,10 +250,13 @@ def example_create_sms_campaign(client: ActiveTrailClient) -> bool:
         bool: True if successful, False otherwise.
     """
     try:
-        print("\n=== Creating an SMS campaign ===")
-        
-        # Create tomorrow's date for scheduling
-        tomorrow = datetime.datetime.now() + datetime.timedelta(days=1)
+        logger.info("\n=== Creating an SMS campaign ===")
+        from active_trail.dto import SMSCampaignDTO, SMSCampaignSchedulingDTO
+        from active_trail.dto.sms_campaigns import ApiSmsCampaignSegment
+
+        # One datetime.now() per run, reused for scheduling and naming.
+        now = datetime.datetime.now()
+        tomorrow = now + datetime.timedelta(days=1)
         
         # Create segment and scheduling objects
         segment = ApiSmsCampaignSegment(
@@ -249,7 +271,7 @@ def example_create_sms_campaign(client: ActiveTrailClient) -> bool:
         
         # Create SMS campaign using DTO
         sms_campaign = SMSCampaignDTO(
-            name=f"Test SMS Campaign {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            name=f"Test SMS Campaign {now.strftime('%Y-%m-%d %H:%M:%S')}",
             content="This is a test SMS campaign",
             unsubscribe_text="Reply STOP to unsubscribe",
             segment=segment,
@@ -261,10 +283,10 @@ def example_create_sms_campaign(client: ActiveTrailClient) -> bool:
         
         sms_campaign_result = client.sms_campaigns.create(sms_campaign)
         sms_campaign_id = sms_campaign_result.get("id")
-        print(f"Created SMS campaign: {sms_campaign_id}")
+        logger.info(f"Created SMS campaign: {sms_campaign_id}")
         return True
     except ActiveTrailError as e:
-        print(f"Error creating SMS campaign: {e}")
+        logger.info(f"Error creating SMS campaign: {e}")
         return False
 
 
@@ -279,9 +301,9 @@ def example_manage_webhooks(client: ActiveTrailClient) -> bool:
         bool: True if successful, False otherwise.
     """
     try:
-        print("\n=== Managing webhooks ===")
+        logger.info("\n=== Managing webhooks ===")
         webhooks = client.webhooks.list()
-        print(f"Found {len(webhooks.get('webhooks', []))} webhooks")
+        logger.info(f"Found {len(webhooks.get('webhooks', []))} webhooks")
         
         # Create a webhook using DTO
         webhook = WebhookDTO(
@@ -291,23 +313,23 @@ def example_manage_webhooks(client: ActiveTrailClient) -> bool:
         )
         
         # Create the webhook
-        print("\n=== Creating a webhook ===")
+        logger.info("\n=== Creating a webhook ===")
         webhook_data = client.webhooks.create(webhook)
         webhook_id = webhook_data.get("id")
-        print(f"Created webhook: {webhook_id}")
+        logger.info(f"Created webhook: {webhook_id}")
         
         # Test the webhook
-        print("\n=== Testing the webhook ===")
+        logger.info("\n=== Testing the webhook ===")
         test_result = client.webhooks.test(webhook_id)
-        print(f"Webhook test result: {test_result}")
+        logger.info(f"Webhook test result: {test_result}")
         
         # Delete the webhook
-        print("\n=== Deleting the webhook ===")
+        logger.info("\n=== Deleting the webhook ===")
         client.webhooks.delete(webhook_id)
-        print(f"Deleted webhook: {webhook_id}")
+        logger.info(f"Deleted webhook: {webhook_id}")
         return True
     except ActiveTrailError as e:
-        print(f"Error managing webhooks: {e}")
+        logger.info(f"Error managing webhooks: {e}")
         return False
 
 
@@ -322,14 +344,19 @@ def example_work_with_groups(client: ActiveTrailClient) -> bool:
         bool: True if successful, False otherwise.
     """
     try:
-        print("\n=== Working with groups ===")
-        
+        logger.info("\n=== Working with groups ===")
+        from active_trail.dto import ContactDTO, GroupDTO
+
         # List groups
         groups = client.groups.list(limit=5)
-        print(f"Found {len(groups.get('groups', []))} groups")
+        logger.info(f"Found {len(groups.get('groups', []))} groups")
         
+        # One datetime.now() per run, shared by the group name and the
+        # generated contact emails.
+        now = datetime.datetime.now()
+
         # Create a group using DTO
-        group_name = f"Test Group {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+        group_name = f"Test Group {now.strftime('%Y-%m-%d %H:%M:%S')}"
         group = GroupDTO(
             name=group_name,
             description="A test group created by the SDK"
@@ -337,26 +364,27 @@ def example_work_with_groups(client: ActiveTrailClient) -> bool:
         
         new_group = client.groups.create(group)
         group_id = new_group.get("id")
-        print(f"Created group: {group_id}")
+        logger.info(f"Created group: {group_id}")
         
         # Get contacts in the group
         group_contacts = client.groups.get_contacts(group_id)
-        print(f"Group has {len(group_contacts.get('contacts', []))} contacts")
+        logger.info(f"Group has {len(group_contacts.get('contacts', []))} contacts")
         
-        # Add a contact to the group
-        contact_email = f"example_{datetime.datetime.now().timestamp()}@example.com"
-        contact = ContactDTO(email=contact_email)
-        client.contacts.create(contact)
-        client.groups.add_contact(group_id, contact_email)
-        print(f"Added contact {contact_email} to group")
+        # Add a few contacts to the group via the bulk endpoints: one
+        # request body carrying N items instead of N round trips each.
+        timestamp = now.timestamp()
+        emails = [f"example_{timestamp}_{i}@example.com" for i in range(3)]
+        client.contacts.create_many([ContactDTO(email=email) for email in emails])
+        client.groups.add_contacts(group_id, emails)
+        logger.info(f"Added {len(emails)} contacts to group")
         
         # Delete the group
         client.groups.delete(group_id)
-        print(f"Deleted group: {group_id}")
+        logger.info(f"Deleted group: {group_id}")
         
         return True
     except ActiveTrailError as e:
-        print(f"Error working with groups: {e}")
+        logger.info(f"Error working with groups: {e}")
         return False
 
 
@@ -371,11 +399,11 @@ def example_two_way_sms(client: ActiveTrailClient) -> bool:
         bool: True if successful, False otherwise.
     """
     try:
-        print("\n=== Working with two-way SMS ===")
+        logger.info("\n=== Working with two-way SMS ===")
         
         # List SMS replies
         replies = client.two_way_sms.list(limit=5)
-        print(f"Found {len(replies.get('replies', []))} SMS replies")
+        logger.info(f"Found {len(replies.get('replies', []))} SMS replies")
         
         # If there are replies, respond to the first one
         if replies.get('replies'):
@@ -384,11 +412,11 @@ def example_two_way_sms(client: ActiveTrailClient) -> bool:
                 reply_id=reply_id,
                 message="Thank you for your response!"
             )
-            print(f"Sent response to SMS reply: {response}")
+            logger.info(f"Sent response to SMS reply: {response}")
         
         return True
     except ActiveTrailError as e:
-        print(f"Error working with two-way SMS: {e}")
+        logger.info(f"Error working with two-way SMS: {e}")
         return False
 
 
@@ -403,84 +431,136 @@ def example_sms_reports(client: ActiveTrailClient) -> bool:
         bool: True if successful, False otherwise.
     """
     try:
-        print("\n=== Working with SMS reports ===")
+        logger.info("\n=== Working with SMS reports ===")
         
         # List SMS reports
         reports = client.sms_reports.list(limit=5)
-        print(f"Found {len(reports.get('reports', []))} SMS reports")
+        logger.info(f"Found {len(reports.get('reports', []))} SMS reports")
         
         # If there are reports, get details for the first one
         if reports.get('reports'):
             report_id = reports['reports'][0]['id']
             details = client.sms_reports.get_details(report_id)
-            print(f"SMS report details: {details}")
+            logger.info(f"SMS report details: {details}")
         
         return True
     except ActiveTrailError as e:
-        print(f"Error working with SMS reports: {e}")
+        logger.info(f"Error working with SMS reports: {e}")
         return False
 
 
-def run_examples(examples_to_run: List[str], client: ActiveTrailClient) -> Dict[str, bool]:
+# Registry of available examples, built once at import time. The proxy is a
+# read-only view, so callers can iterate it without the dict being rebuilt
+# (or mutated) per run_examples call.
+EXAMPLES: Mapping[str, Callable[[ActiveTrailClient], bool]] = MappingProxyType({
+    "contacts": example_get_contacts,
+    "create_contact": example_create_contact,
+    "email": example_send_operational_email,
+    "sms": example_send_operational_sms,
+    "email_campaign": example_create_and_schedule_email_campaign,
+    "sms_campaign": example_create_sms_campaign,
+    "webhooks": example_manage_webhooks,
+    "groups": example_work_with_groups,
+    "two_way_sms": example_two_way_sms,
+    "sms_reports": example_sms_reports
+})
+
+# Names accepted by --examples; validated by argparse itself so typos are
+# rejected before run_examples executes.
+VALID_EXAMPLES = tuple(EXAMPLES) + ("all",)
+
+
+def run_examples(
+    examples_to_run: List[str],
+    client: ActiveTrailClient,
+    max_workers: int = 1,
+    fail_fast: bool = False
+) -> Dict[str, bool]:
     """
     Run the specified examples.
-    
+
+    With max_workers > 1, independent example flows run concurrently on a
+    thread pool over the client's shared connection pool, so total wall time
+    approaches the slowest example instead of the sum of all of them.
+
     Args:
         examples_to_run: List of example names to run.
         client: The ActiveTrail client instance.
-        
+        max_workers: Number of examples to run concurrently (default: 1).
+        fail_fast: Stop after the first failed example instead of running
+            the remainder (sequential mode only).
+
     Returns:
         Dict[str, bool]: Dictionary with example names as keys and success status as values.
     """
-    # Map of available examples
-    examples = {
-        "contacts": example_get_contacts,
-        "create_contact": example_create_contact,
-        "email": example_send_operational_email,
-        "sms": example_send_operational_sms,
-        "email_campaign": example_create_and_schedule_email_campaign,
-        "sms_campaign": example_create_sms_campaign,
-        "webhooks": example_manage_webhooks,
-        "groups": example_work_with_groups,
-        "two_way_sms": example_two_way_sms,
-        "sms_reports": example_sms_reports
-    }
-    
-    # If "all" is in the list, run all examples
-    if "all" in examples_to_run:
-        examples_to_run = list(examples.keys())
-    
-    # Run the specified examples and collect results
+    # Pre-filter against the registry once; the run loops below then skip
+    # the per-iteration membership check. CLI input is already validated by
+    # argparse choices, so unknown names only occur for programmatic callers
+    # and are silently dropped by the filter.
     results = {}
-    for example_name in examples_to_run:
-        if example_name in examples:
-            print(f"\n\n{'=' * 40}\nRunning example: {example_name}\n{'=' * 40}")
-            results[example_name] = examples[example_name](client)
-        else:
-            print(f"Unknown example: {example_name}")
-            results[example_name] = False
-    
+    if "all" in examples_to_run:
+        names = list(EXAMPLES)
+    else:
+        names = [name for name in examples_to_run if name in EXAMPLES]
+
+    if max_workers > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {}
+            for example_name in names:
+                logger.info(f"\n\n{'=' * 40}\nRunning example: {example_name}\n{'=' * 40}")
+                futures[example_name] = executor.submit(EXAMPLES[example_name], client)
+            for example_name, future in futures.items():
+                results[example_name] = future.result()
+        return results
+
+    for example_name in names:
+        logger.info(f"\n\n{'=' * 40}\nRunning example: {example_name}\n{'=' * 40}")
+        results[example_name] = EXAMPLES[example_name](client)
+        if fail_fast and not results[example_name]:
+            logger.info(f"Stopping after failed example: {example_name}")
+            break
+
     return results
 
 
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser once; repeated parse_args calls reuse it."""
+    parser = argparse.ArgumentParser(description="ActiveTrail SDK usage examples")
+
+    parser.add_argument(
+        "--examples",
+        nargs="+",
+        default=["all"],
+        choices=VALID_EXAMPLES,
+        help="Examples to run (default: all)"
+    )
+
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Run up to N examples concurrently (default: 1, sequential)"
+    )
+
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Stop after the first failed example (sequential mode only)"
+    )
+
+    return parser
+
+
 def parse_args() -> argparse.Namespace:
     """
     Parse command-line arguments.
-    
+
     Returns:
         argparse.Namespace: The parsed arguments.
     """
-    parser = argparse.ArgumentParser(description="ActiveTrail SDK usage examples")
-    
-    parser.add_argument(
-        "--examples", 
-        nargs="+", 
-        default=["all"],
-        help="Examples to run. Options: contacts, create_contact, email, sms, email_campaign, " + 
-             "sms_campaign, webhooks, groups, two_way_sms, sms_reports, all"
-    )
-    
-    return parser.parse_args()
+    return _build_parser().parse_args()
 
 
 def main():
@@ -490,26 +570,55 @@ def main():
     
     # Configure logging
     configure_logging(level=logging.INFO)
-    
+
+    # Example output: a MemoryHandler buffers records and hands them to
+    # stdout in batches, so concurrent examples don't contend on stdout's
+    # lock one line at a time.
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+    buffered_handler = logging.handlers.MemoryHandler(
+        capacity=64,
+        target=stream_handler
+    )
+    logger.addHandler(buffered_handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
     # Get client
     client = get_client()
     if not client:
         return 1
-    
-    # Run examples
-    results = run_examples(args.examples, client)
+
+    # One exit stack owns every resource for the run: the client (and with
+    # it the pooled keep-alive session) is entered once and closed
+    # deterministically however the examples finish.
+    with contextlib.ExitStack() as stack:
+        stack.enter_context(client)
+
+        # Run examples
+        results = run_examples(
+            args.examples,
+            client,
+            max_workers=args.parallel,
+            fail_fast=args.fail_fast
+        )
     
     # Print summary
-    print("\n\n" + "=" * 40)
-    print("EXECUTION SUMMARY")
-    print("=" * 40)
+    logger.info("\n\n" + "=" * 40)
+    logger.info("EXECUTION SUMMARY")
+    logger.info("=" * 40)
     
     for example, success in results.items():
         status = "✓ SUCCESS" if success else "✗ FAILED"
-        print(f"{example}: {status}")
-    
-    # Return non-zero exit code if any example failed
-    return 0 if all(results.values()) else 1
+        logger.info(f"{example}: {status}")
+
+    # Drain whatever is still buffered before exiting
+    buffered_handler.flush()
+
+    # Return non-zero exit code if any example failed; next() stops at the
+    # first failure instead of scanning the remaining entries.
+    failed = next((name for name, ok in results.items() if not ok), None)
+    return 1 if failed is not None else 0
 
 
 if __name__ == "__main__":
@@ -0,0 +1,139 @@
+"""
+Shared pytest fixtures for the ActiveTrail SDK test suite.
+"""
+
+import json
+import socket
+from unittest.mock import Mock, seal
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+from active_trail.client import ActiveTrailClient
+
+API_KEY = "test_api_key"
+
+
+def pytest_configure(config):
+    """
+    Force-import the SDK modules once per process before collection.
+
+    Each test module's own imports then resolve through sys.modules, so
+    under xdist every worker pays the package import cost exactly once
+    up front instead of interleaved with its first test file.
+    """
+    import active_trail.base_api  # noqa: F401
+    import active_trail.contacts  # noqa: F401
+    import active_trail.groups  # noqa: F401
+    import active_trail.sms_campaigns  # noqa: F401
+    import active_trail.webhooks  # noqa: F401
+
+
+class StubAdapter(HTTPAdapter):
+    """
+    Transport-level stub mounted on the client's session.
+
+    Short-circuits at the adapter layer with a canned real requests.Response
+    (the same point requests_mock hooks into), so tests skip both the
+    network and per-test MagicMock attribute wiring. Records the last
+    prepared request and send kwargs for assertions.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.last_request = None
+        self.last_kwargs = None
+        self._response = None
+        self._exception = None
+
+    def set_response(self, status_code=200, json_body=None, content=b"", headers=None):
+        """Configure the response returned by the next send() calls."""
+        response = requests.Response()
+        response.status_code = status_code
+        if json_body is not None:
+            content = json.dumps(json_body).encode()
+            headers = {"Content-Type": "application/json", **(headers or {})}
+        response._content = content
+        response.headers.update(headers or {})
+        self._response = response
+        return response
+
+    def set_exception(self, exc):
+        """Make subsequent send() calls raise `exc` instead of responding."""
+        self._exception = exc
+
+    def send(self, request, **kwargs):
+        self.last_request = request
+        self.last_kwargs = kwargs
+        if self._exception is not None:
+            raise self._exception
+        self._response.request = request
+        return self._response
+
+
+@pytest.fixture(scope="module")
+def _module_mock_client():
+    """One spec'd mock per module; tests get it freshly reset via mock_client."""
+    client = Mock(spec=ActiveTrailClient)
+    # Touch the HTTP verbs so their child mocks exist up front, then seal:
+    # attribute access becomes a plain lookup instead of the lazy
+    # child-creation path, and anything outside the verbs raises.
+    client.get, client.post, client.put, client.delete
+    seal(client)
+    return client
+
+
+@pytest.fixture
+def mock_client(_module_mock_client):
+    """
+    Mock ActiveTrail client for API-module tests.
+
+    Spec'd against ActiveTrailClient so only real client attributes exist:
+    typos fail immediately instead of silently returning child mocks, and
+    attribute access skips MagicMock's lazy child-mock creation. Built once
+    per module and recursively reset before each test, so per-test cost is
+    a reset rather than re-wiring a fresh mock's method children.
+    """
+    _module_mock_client.reset_mock(return_value=True, side_effect=True)
+    return _module_mock_client
+
+
+@pytest.fixture(scope="module")
+def client():
+    """
+    Real ActiveTrailClient shared across a module's tests.
+
+    Outbound calls are mocked per test and no test mutates client state, so
+    one instance per module avoids re-building the requests.Session (and its
+    adapters and header dict) for every test. Tests that need a fresh
+    instance construct one locally.
+
+    timeout=1 so that if a request ever escapes the stubs it fails within a
+    second instead of hanging for the 30-second production default.
+    """
+    return ActiveTrailClient(api_key=API_KEY, timeout=1)
+
+
+@pytest.fixture(autouse=True)
+def _no_network(monkeypatch):
+    """
+    Fail fast if a test ever reaches the real network.
+
+    Every HTTP path is supposed to be intercepted (StubAdapter, patched
+    Session methods, or a mock client); blocking socket creation turns a
+    missed interception into an immediate error instead of a request that
+    waits out its timeout.
+    """
+    def _blocked(*args, **kwargs):
+        raise RuntimeError("Test attempted network access; mock the transport")
+
+    monkeypatch.setattr(socket, "socket", _blocked)
+
+
+@pytest.fixture
+def transport(client):
+    """Stub transport mounted on the shared client for HTTP-level tests."""
+    adapter = StubAdapter()
+    client.session.mount("https://", adapter)
+    return adapter
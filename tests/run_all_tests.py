@@ -3,66 +3,44 @@
 Test runner for the ActiveTrail SDK - runs all tests with coverage report.
 """
 
-import unittest
+import argparse
+import os
 import sys
-import coverage
 
-cov = coverage.Coverage(
-    source=["active_trail"],
-    omit=["*/__pycache__/*", "*/tests/*", "*/site-packages/*"]
-)
-cov.start()
+import pytest
 
-# Import all test modules
-from test_client import TestActiveTrailClient
-from test_base_api import (
-    TestBaseAPI, 
-    TestCrudAPI, 
-    TestNestedResourceAPI, 
-    TestCampaignBaseAPI
-)
-from test_groups import TestGroupsAPI
-from test_contacts import TestContactsAPI
-from test_utils import TestUtils
-from test_sms_campaigns import TestSMSCampaignsAPI
+# On Python 3.12+ use coverage's sys.monitoring core (PEP 669): unlike
+# sys.settrace it adds near-zero overhead to frames that aren't under
+# measurement, which cuts most of coverage's 2-5x tracing slowdown.
+if sys.version_info >= (3, 12):
+    os.environ.setdefault("COVERAGE_CORE", "sysmon")
 
 
-def create_test_suite():
-    """Create and return a test suite of all tests."""
-    # Initialize the test suite
-    loader = unittest.TestLoader()
-    suite = unittest.TestSuite()
-    
-    # Add tests to the suite
-    suite.addTests(loader.loadTestsFromTestCase(TestActiveTrailClient))
-    suite.addTests(loader.loadTestsFromTestCase(TestBaseAPI))
-    suite.addTests(loader.loadTestsFromTestCase(TestCrudAPI))
-    suite.addTests(loader.loadTestsFromTestCase(TestNestedResourceAPI))
-    suite.addTests(loader.loadTestsFromTestCase(TestCampaignBaseAPI))
-    suite.addTests(loader.loadTestsFromTestCase(TestGroupsAPI))
-    suite.addTests(loader.loadTestsFromTestCase(TestContactsAPI))
-    suite.addTests(loader.loadTestsFromTestCase(TestUtils))
-    suite.addTests(loader.loadTestsFromTestCase(TestSMSCampaignsAPI))
-    
-    return suite
+def main() -> int:
+    """Run the full suite via pytest; coverage comes from pytest.ini."""
+    parser = argparse.ArgumentParser(description="Run the ActiveTrail SDK test suite")
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of worker processes (needs pytest-xdist; 1 runs serially)"
+    )
+    args = parser.parse_args()
 
+    pytest_args = [os.path.dirname(os.path.abspath(__file__))]
+    if args.jobs > 1:
+        try:
+            import xdist  # noqa: F401
+            # loadfile keeps each test module on one worker, so module-scoped
+            # fixtures (the shared client) are built once per file, not once
+            # per worker that happens to pick up its tests.
+            pytest_args = ["-n", str(args.jobs), "--dist", "loadfile"] + pytest_args
+        except ImportError:
+            print("pytest-xdist not installed; running serially")
 
-if __name__ == "__main__":
-    """Run all tests and show coverage report."""
-    # Create the test suite
-    suite = create_test_suite()
-    
-    # Run the tests
     print("Running tests...")
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
-    
-    # Stop coverage and print report
-    cov.stop()
-    cov.save()
-    
-    print("\nCoverage report:")
-    cov.report()
-    
-    # Return non-zero exit code on test failures
-    sys.exit(not result.wasSuccessful()) 
\ No newline at end of file
+    return pytest.main(pytest_args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,316 +2,207 @@
 Tests for the base API implementations.
 """
 
-import unittest
-from unittest.mock import MagicMock
+import pytest
 
 from active_trail.base_api import BaseAPI, CrudAPI, NestedResourceAPI, CampaignBaseAPI
 
+RESOURCE_PATH = "test-resource"
+PARENT_PATH = "parent-resource"
+NESTED_PATH = "nested-resource"
 
-class TestBaseAPI(unittest.TestCase):
-    """Test cases for the BaseAPI class."""
-
-    def setUp(self):
-        """Set up test environment."""
-        self.mock_client = MagicMock()
-        self.base_api = BaseAPI(self.mock_client)
-    
-    def test_init(self):
-        """Test initialization."""
-        self.assertEqual(self.base_api.client, self.mock_client)
-
-
-class TestCrudAPI(unittest.TestCase):
-    """Test cases for the CrudAPI class."""
-
-    def setUp(self):
-        """Set up test environment."""
-        self.mock_client = MagicMock()
-        self.resource_path = "test-resource"
-        self.crud_api = CrudAPI(self.mock_client, self.resource_path)
-    
-    def test_init(self):
-        """Test initialization."""
-        self.assertEqual(self.crud_api.client, self.mock_client)
-        self.assertEqual(self.crud_api.resource_path, self.resource_path)
-    
-    def test_list(self):
-        """Test list method."""
-        # Set up mock return value
-        self.mock_client.get.return_value = {"items": [{"id": "1"}, {"id": "2"}]}
-        
-        # Call the method
-        result = self.crud_api.list(limit=10, offset=5, filter="test")
-        
-        # Verify method called correctly
-        self.mock_client.get.assert_called_once_with(
-            self.resource_path, 
-            params={"limit": 10, "offset": 5, "filter": "test"}
-        )
-        
-        # Verify result
-        self.assertEqual(result, {"items": [{"id": "1"}, {"id": "2"}]})
-    
-    def test_get(self):
-        """Test get method."""
-        # Set up mock return value
-        self.mock_client.get.return_value = {"id": "123", "name": "Test"}
-        
-        # Call the method
-        result = self.crud_api.get("123")
-        
-        # Verify method called correctly
-        self.mock_client.get.assert_called_once_with(f"{self.resource_path}/123")
-        
-        # Verify result
-        self.assertEqual(result, {"id": "123", "name": "Test"})
-    
-    def test_create(self):
-        """Test create method."""
-        # Set up mock return value
-        self.mock_client.post.return_value = {"id": "123", "name": "New Resource"}
-        
-        # Data to send
-        data = {"name": "New Resource"}
-        
-        # Call the method
-        result = self.crud_api.create(data)
-        
-        # Verify method called correctly
-        self.mock_client.post.assert_called_once_with(self.resource_path, json=data)
-        
-        # Verify result
-        self.assertEqual(result, {"id": "123", "name": "New Resource"})
-    
-    def test_update(self):
-        """Test update method."""
-        # Set up mock return value
-        self.mock_client.put.return_value = {"id": "123", "name": "Updated Resource"}
-        
-        # Data to send
-        data = {"name": "Updated Resource"}
-        
-        # Call the method
-        result = self.crud_api.update("123", data)
-        
-        # Verify method called correctly
-        self.mock_client.put.assert_called_once_with(f"{self.resource_path}/123", json=data)
-        
-        # Verify result
-        self.assertEqual(result, {"id": "123", "name": "Updated Resource"})
-    
-    def test_delete(self):
-        """Test delete method."""
-        # Set up mock return value
-        self.mock_client.delete.return_value = {}
-        
-        # Call the method
-        result = self.crud_api.delete("123")
-        
-        # Verify method called correctly
-        self.mock_client.delete.assert_called_once_with(f"{self.resource_path}/123")
-        
-        # Verify result
-        self.assertEqual(result, {})
-
-
-class TestNestedResourceAPI(unittest.TestCase):
-    """Test cases for the NestedResourceAPI class."""
-
-    def setUp(self):
-        """Set up test environment."""
-        self.mock_client = MagicMock()
-        self.parent_path = "parent-resource"
-        self.resource_path = "nested-resource"
-        self.nested_api = NestedResourceAPI(
-            self.mock_client, self.parent_path, self.resource_path
-        )
-    
-    def test_init(self):
-        """Test initialization."""
-        self.assertEqual(self.nested_api.client, self.mock_client)
-        self.assertEqual(self.nested_api.parent_path, self.parent_path)
-        self.assertEqual(self.nested_api.resource_path, self.resource_path)
-    
-    def test_list(self):
-        """Test list method."""
-        # Set up mock return value
-        self.mock_client.get.return_value = {"items": [{"id": "1"}, {"id": "2"}]}
-        
-        # Call the method
-        result = self.nested_api.list("parent-123", limit=10, offset=5, filter="test")
-        
-        # Verify method called correctly
-        self.mock_client.get.assert_called_once_with(
-            f"{self.parent_path}/parent-123/{self.resource_path}", 
-            params={"limit": 10, "offset": 5, "filter": "test"}
-        )
-        
-        # Verify result
-        self.assertEqual(result, {"items": [{"id": "1"}, {"id": "2"}]})
-    
-    def test_get(self):
-        """Test get method."""
-        # Set up mock return value
-        self.mock_client.get.return_value = {"id": "123", "name": "Test"}
-        
-        # Call the method
-        result = self.nested_api.get("parent-123", "123")
-        
-        # Verify method called correctly
-        self.mock_client.get.assert_called_once_with(
-            f"{self.parent_path}/parent-123/{self.resource_path}/123"
-        )
-        
-        # Verify result
-        self.assertEqual(result, {"id": "123", "name": "Test"})
-    
-    def test_create(self):
-        """Test create method."""
-        # Set up mock return value
-        self.mock_client.post.return_value = {"id": "123", "name": "New Resource"}
-        
-        # Data to send
-        data = {"name": "New Resource"}
-        
-        # Call the method
-        result = self.nested_api.create("parent-123", data)
-        
-        # Verify method called correctly
-        self.mock_client.post.assert_called_once_with(
-            f"{self.parent_path}/parent-123/{self.resource_path}", json=data
-        )
-        
-        # Verify result
-        self.assertEqual(result, {"id": "123", "name": "New Resource"})
-    
-    def test_update(self):
-        """Test update method."""
-        # Set up mock return value
-        self.mock_client.put.return_value = {"id": "123", "name": "Updated Resource"}
-        
-        # Data to send
-        data = {"name": "Updated Resource"}
-        
-        # Call the method
-        result = self.nested_api.update("parent-123", "123", data)
-        
-        # Verify method called correctly
-        self.mock_client.put.assert_called_once_with(
-            f"{self.parent_path}/parent-123/{self.resource_path}/123", json=data
-        )
-        
-        # Verify result
-        self.assertEqual(result, {"id": "123", "name": "Updated Resource"})
-    
-    def test_delete(self):
-        """Test delete method."""
-        # Set up mock return value
-        self.mock_client.delete.return_value = {}
-        
-        # Call the method
-        result = self.nested_api.delete("parent-123", "123")
-        
-        # Verify method called correctly
-        self.mock_client.delete.assert_called_once_with(
-            f"{self.parent_path}/parent-123/{self.resource_path}/123"
-        )
-        
-        # Verify result
-        self.assertEqual(result, {})
-
-
-class TestCampaignBaseAPI(unittest.TestCase):
-    """Test cases for the CampaignBaseAPI class."""
-
-    def setUp(self):
-        """Set up test environment."""
-        self.mock_client = MagicMock()
-        self.resource_path = "campaigns"
-        self.campaign_api = CampaignBaseAPI(self.mock_client, self.resource_path)
-    
-    def test_init(self):
-        """Test initialization."""
-        self.assertEqual(self.campaign_api.client, self.mock_client)
-        self.assertEqual(self.campaign_api.resource_path, self.resource_path)
-    
-    def test_schedule(self):
-        """Test schedule method."""
-        # Set up mock return value
-        self.mock_client.post.return_value = {"status": "scheduled"}
-        
-        # Schedule data
-        schedule_data = {
-            "send_time": "2023-01-01T12:00:00Z",
-            "time_zone": "UTC"
-        }
-        
-        # Call the method
-        result = self.campaign_api.schedule("123", schedule_data)
-        
-        # Verify method called correctly
-        self.mock_client.post.assert_called_once_with(
-            f"{self.resource_path}/123/schedule", json=schedule_data
-        )
-        
-        # Verify result
-        self.assertEqual(result, {"status": "scheduled"})
-    
-    def test_send_now(self):
-        """Test send_now method."""
-        # Set up mock return value
-        self.mock_client.post.return_value = {"status": "sending"}
-        
-        # Call the method
-        result = self.campaign_api.send_now("123")
-        
-        # Verify method called correctly
-        self.mock_client.post.assert_called_once_with(f"{self.resource_path}/123/send")
-        
-        # Verify result
-        self.assertEqual(result, {"status": "sending"})
-    
-    def test_get_statistics(self):
-        """Test get_statistics method."""
-        # Set up mock return value
-        self.mock_client.get.return_value = {"sent": 100, "delivered": 95}
-        
-        # Call the method
-        result = self.campaign_api.get_statistics("123")
-        
-        # Verify method called correctly
-        self.mock_client.get.assert_called_once_with(f"{self.resource_path}/123/statistics")
-        
-        # Verify result
-        self.assertEqual(result, {"sent": 100, "delivered": 95})
-    
-    def test_clone(self):
-        """Test clone method."""
-        # Set up mock return value
-        self.mock_client.post.return_value = {"id": "456", "name": "Copy of Campaign"}
-        
-        # Call the method without name
-        result = self.campaign_api.clone("123")
-        
-        # Verify method called correctly
-        self.mock_client.post.assert_called_once_with(
-            f"{self.resource_path}/123/clone", json={}
-        )
-        
-        # Verify result
-        self.assertEqual(result, {"id": "456", "name": "Copy of Campaign"})
-        
-        # Reset mock
-        self.mock_client.post.reset_mock()
-        
-        # Call the method with name
-        result = self.campaign_api.clone("123", name="New Name")
-        
-        # Verify method called correctly
-        self.mock_client.post.assert_called_once_with(
-            f"{self.resource_path}/123/clone", json={"name": "New Name"}
-        )
-
-
-if __name__ == "__main__":
-    unittest.main() 
\ No newline at end of file
+# Canonical payloads shared across tests; built once at import instead of as
+# fresh dict literals inside each test body. Tests treat them as read-only.
+NEW_DATA = {"name": "New Resource"}
+UPDATED_DATA = {"name": "Updated Resource"}
+SCHEDULE_DATA = {
+    "send_time": "2023-01-01T12:00:00Z",
+    "time_zone": "UTC"
+}
+
+
+@pytest.fixture
+def base_api(mock_client):
+    """BaseAPI instance over the mock client."""
+    return BaseAPI(mock_client)
+
+
+@pytest.fixture
+def crud_api(mock_client):
+    """CrudAPI instance over the mock client."""
+    return CrudAPI(mock_client, RESOURCE_PATH)
+
+
+@pytest.fixture
+def nested_api(mock_client):
+    """NestedResourceAPI instance over the mock client."""
+    return NestedResourceAPI(mock_client, PARENT_PATH, NESTED_PATH)
+
+
+@pytest.fixture
+def campaign_api(mock_client):
+    """CampaignBaseAPI instance over the mock client."""
+    return CampaignBaseAPI(mock_client, "campaigns")
+
+
+@pytest.fixture(params=["crud", "nested"])
+def api_under_test(request, mock_client):
+    """
+    CRUD-style API under test, parametrized over both implementations.
+
+    Returns (api, extra_args, base_url): `extra_args` are the positional
+    arguments each method needs before the resource id (the parent id for
+    the nested API), and `base_url` is the collection URL those arguments
+    resolve to.
+    """
+    if request.param == "crud":
+        return CrudAPI(mock_client, RESOURCE_PATH), (), RESOURCE_PATH
+    return (
+        NestedResourceAPI(mock_client, PARENT_PATH, NESTED_PATH),
+        ("parent-123",),
+        f"{PARENT_PATH}/parent-123/{NESTED_PATH}"
+    )
+
+
+# region Initialization
+
+def test_base_init(base_api, mock_client):
+    """Test initialization."""
+    assert base_api.client is mock_client
+
+
+def test_crud_init(crud_api, mock_client):
+    """Test initialization."""
+    assert crud_api.client is mock_client
+    assert crud_api.resource_path == RESOURCE_PATH
+
+
+def test_nested_init(nested_api, mock_client):
+    """Test initialization."""
+    assert nested_api.client is mock_client
+    assert nested_api.parent_path == PARENT_PATH
+    assert nested_api.resource_path == NESTED_PATH
+
+
+def test_campaign_init(campaign_api, mock_client):
+    """Test initialization."""
+    assert campaign_api.client is mock_client
+    assert campaign_api.resource_path == "campaigns"
+
+# endregion
+
+
+# region CRUD methods (shared between CrudAPI and NestedResourceAPI)
+
+def test_list(api_under_test, mock_client):
+    """Test list method."""
+    api, extra_args, base_url = api_under_test
+    mock_client.get.return_value = {"items": [{"id": "1"}, {"id": "2"}]}
+
+    result = api.list(*extra_args, limit=10, offset=5, filter="test")
+
+    mock_client.get.assert_called_once_with(
+        base_url,
+        params={"limit": 10, "offset": 5, "filter": "test"}
+    )
+    assert result == {"items": [{"id": "1"}, {"id": "2"}]}
+
+
+def test_get(api_under_test, mock_client):
+    """Test get method."""
+    api, extra_args, base_url = api_under_test
+    mock_client.get.return_value = {"id": "123", "name": "Test"}
+
+    result = api.get(*extra_args, "123")
+
+    mock_client.get.assert_called_once_with(f"{base_url}/123")
+    assert result == {"id": "123", "name": "Test"}
+
+
+def test_create(api_under_test, mock_client):
+    """Test create method."""
+    api, extra_args, base_url = api_under_test
+    mock_client.post.return_value = {"id": "123", "name": "New Resource"}
+
+    result = api.create(*extra_args, NEW_DATA)
+
+    mock_client.post.assert_called_once_with(base_url, json=NEW_DATA)
+    assert result == {"id": "123", "name": "New Resource"}
+
+
+def test_update(api_under_test, mock_client):
+    """Test update method."""
+    api, extra_args, base_url = api_under_test
+    mock_client.put.return_value = {"id": "123", "name": "Updated Resource"}
+
+    result = api.update(*extra_args, "123", UPDATED_DATA)
+
+    mock_client.put.assert_called_once_with(f"{base_url}/123", json=UPDATED_DATA)
+    assert result == {"id": "123", "name": "Updated Resource"}
+
+
+def test_delete(api_under_test, mock_client):
+    """Test delete method."""
+    api, extra_args, base_url = api_under_test
+    mock_client.delete.return_value = {}
+
+    result = api.delete(*extra_args, "123")
+
+    mock_client.delete.assert_called_once_with(f"{base_url}/123")
+    assert result == {}
+
+# endregion
+
+
+# region CampaignBaseAPI
+
+def test_campaign_schedule(campaign_api, mock_client):
+    """Test schedule method."""
+    mock_client.post.return_value = {"status": "scheduled"}
+
+    result = campaign_api.schedule("123", SCHEDULE_DATA)
+
+    mock_client.post.assert_called_once_with(
+        "campaigns/123/schedule", json=SCHEDULE_DATA
+    )
+    assert result == {"status": "scheduled"}
+
+
+def test_campaign_send_now(campaign_api, mock_client):
+    """Test send_now method."""
+    mock_client.post.return_value = {"status": "sending"}
+
+    result = campaign_api.send_now("123")
+
+    mock_client.post.assert_called_once_with("campaigns/123/send")
+    assert result == {"status": "sending"}
+
+
+def test_campaign_get_statistics(campaign_api, mock_client):
+    """Test get_statistics method."""
+    mock_client.get.return_value = {"sent": 100, "delivered": 95}
+
+    result = campaign_api.get_statistics("123")
+
+    mock_client.get.assert_called_once_with("campaigns/123/statistics")
+    assert result == {"sent": 100, "delivered": 95}
+
+
+def test_campaign_clone(campaign_api, mock_client):
+    """Test clone method."""
+    mock_client.post.return_value = {"id": "456", "name": "Copy of Campaign"}
+
+    # Call the method without name
+    result = campaign_api.clone("123")
+
+    mock_client.post.assert_called_once_with("campaigns/123/clone", json={})
+    assert result == {"id": "456", "name": "Copy of Campaign"}
+
+    # Call the method with name
+    mock_client.post.reset_mock()
+    result = campaign_api.clone("123", name="New Name")
+
+    mock_client.post.assert_called_once_with(
+        "campaigns/123/clone", json={"name": "New Name"}
+    )
+
+# endregion
@@ -2,14 +2,13 @@
 Tests for the ActiveTrail client class.
 """
 
-import unittest
-from unittest.mock import patch, MagicMock, call
+from unittest.mock import patch
 
+import pytest
 import requests
 
 from active_trail.client import ActiveTrailClient
 from active_trail.exceptions import (
-    ActiveTrailError,
     AuthenticationError,
     RateLimitError,
     ValidationError,
@@ -18,409 +17,181 @@ from active_trail.exceptions import (
     NetworkError
 )
 
+API_KEY = "test_api_key"
+BASE = "https://webapi.mymarketing.co.il/api/"
 
-class TestActiveTrailClient(unittest.TestCase):
-    """Test cases for the ActiveTrailClient class."""
-
-    def setUp(self):
-        """Set up test environment."""
-        self.api_key = "test_api_key"
-        self.client = ActiveTrailClient(api_key=self.api_key)
-    
-    def test_initialization(self):
-        """Test client initialization."""
-        client = ActiveTrailClient(api_key=self.api_key, timeout=60)
-        
-        self.assertEqual(client.api_key, self.api_key)
-        self.assertEqual(client.timeout, 60)
-        self.assertEqual(client.BASE_URL, "https://webapi.mymarketing.co.il/api/")
-        self.assertEqual(client.session.headers["Authorization"], self.api_key)
-        self.assertEqual(client.session.headers["Content-Type"], "application/json")
-        self.assertEqual(client.session.headers["Accept"], "application/json")
-    
-    @patch("requests.Session.get")
-    def test_get_request(self, mock_get):
-        """Test get method."""
-        # Set up mock response
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"data": "test_data"}
-        mock_response.headers = {"Content-Type": "application/json"}
-        mock_response.content = b'{"data": "test_data"}'
-        mock_get.return_value = mock_response
-        
-        # Call the method
-        result = self.client.get("contacts", params={"limit": 10})
-        
-        # Verify method called correctly
-        mock_get.assert_called_once_with(
-            "https://webapi.mymarketing.co.il/api/contacts",
-            params={"limit": 10},
-            timeout=30
-        )
-        
-        # Verify result
-        self.assertEqual(result, {"data": "test_data"})
-    
-    @patch("requests.Session.post")
-    def test_post_request(self, mock_post):
-        """Test post method."""
-        # Set up mock response
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"id": "123"}
-        mock_response.headers = {"Content-Type": "application/json"}
-        mock_response.content = b'{"id": "123"}'
-        mock_post.return_value = mock_response
-        
-        # Call the method
-        result = self.client.post("contacts", json={"email": "test@example.com"})
-        
-        # Verify method called correctly
-        mock_post.assert_called_once_with(
-            "https://webapi.mymarketing.co.il/api/contacts",
-            params=None,
-            json={"email": "test@example.com"},
-            timeout=30
-        )
-        
-        # Verify result
-        self.assertEqual(result, {"id": "123"})
-    
-    @patch("requests.Session.put")
-    def test_put_request(self, mock_put):
-        """Test put method."""
-        # Set up mock response
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"id": "123", "updated": True}
-        mock_response.headers = {"Content-Type": "application/json"}
-        mock_response.content = b'{"id": "123", "updated": true}'
-        mock_put.return_value = mock_response
-        
-        # Call the method
-        result = self.client.put("contacts/123", json={"first_name": "John"})
-        
-        # Verify method called correctly
-        mock_put.assert_called_once_with(
-            "https://webapi.mymarketing.co.il/api/contacts/123",
-            params=None,
-            json={"first_name": "John"},
-            timeout=30
-        )
-        
-        # Verify result
-        self.assertEqual(result, {"id": "123", "updated": True})
-    
-    @patch("requests.Session.delete")
-    def test_delete_request(self, mock_delete):
-        """Test delete method."""
-        # Set up mock response
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"success": True}
-        mock_response.headers = {"Content-Type": "application/json"}
-        mock_response.content = b'{"success": true}'
-        mock_delete.return_value = mock_response
-        
-        # Call the method
-        result = self.client.delete("contacts/123")
-        
-        # Verify method called correctly
-        mock_delete.assert_called_once_with(
-            "https://webapi.mymarketing.co.il/api/contacts/123",
-            params=None,
-            json=None,
-            timeout=30
-        )
-        
-        # Verify result
-        self.assertEqual(result, {"success": True})
-    
-    @patch("requests.Session.get")
-    def test_non_json_response(self, mock_get):
-        """Test handling of non-JSON response."""
-        # Set up mock response
-        mock_response = MagicMock()
-        mock_response.headers = {"Content-Type": "text/plain"}
-        mock_response.content = b"Success"
-        mock_get.return_value = mock_response
-        
-        # Call the method
-        result = self.client.get("export/123")
-        
-        # Verify result
-        self.assertEqual(result, b"Success")
-    
-    @patch("requests.Session.get")
-    def test_empty_response(self, mock_get):
-        """Test handling of empty response."""
-        # Set up mock response
-        mock_response = MagicMock()
-        mock_response.headers = {"Content-Type": "application/json"}
-        mock_response.content = b""
-        mock_get.return_value = mock_response
-        
-        # Call the method
-        result = self.client.get("some-endpoint")
-        
-        # Verify result
-        self.assertEqual(result, b"")
-    
-    @patch("requests.Session.get")
-    def test_validation_error(self, mock_get):
-        """Test validation error handling."""
-        # Set up mock response
-        mock_response = MagicMock()
-        mock_response.status_code = 400
-        mock_response.json.return_value = {"error": "Invalid parameter"}
-        mock_response.text = '{"error": "Invalid parameter"}'
-        
-        # Set up side effect to raise HTTPError
-        http_error = requests.exceptions.HTTPError()
-        http_error.response = mock_response
-        mock_get.side_effect = http_error
-        
-        # Call the method and check for exception
-        with self.assertRaises(ValidationError) as context:
-            self.client.get("contacts", params={"invalid": "value"})
-        
-        self.assertIn("Validation error", str(context.exception))
-        self.assertIn("Invalid parameter", str(context.exception))
-    
-    @patch("requests.Session.get")
-    def test_authentication_error(self, mock_get):
-        """Test authentication error handling."""
-        # Set up mock response
-        mock_response = MagicMock()
-        mock_response.status_code = 401
-        mock_response.json.return_value = {"error": "Invalid API key"}
-        mock_response.text = '{"error": "Invalid API key"}'
-        
-        # Set up side effect to raise HTTPError
-        http_error = requests.exceptions.HTTPError()
-        http_error.response = mock_response
-        mock_get.side_effect = http_error
-        
-        # Call the method and check for exception
-        with self.assertRaises(AuthenticationError) as context:
-            self.client.get("contacts")
-        
-        self.assertIn("Authentication failed", str(context.exception))
-        self.assertIn("Invalid API key", str(context.exception))
-    
-    @patch("requests.Session.get")
-    def test_not_found_error(self, mock_get):
-        """Test not found error handling."""
-        # Set up mock response
-        mock_response = MagicMock()
-        mock_response.status_code = 404
-        mock_response.json.return_value = {"error": "Resource not found"}
-        mock_response.text = '{"error": "Resource not found"}'
-        
-        # Set up side effect to raise HTTPError
-        http_error = requests.exceptions.HTTPError()
-        http_error.response = mock_response
-        mock_get.side_effect = http_error
-        
-        # Call the method and check for exception
-        with self.assertRaises(NotFoundError) as context:
-            self.client.get("contacts/999")
-        
-        self.assertIn("Resource not found", str(context.exception))
-    
-    @patch("requests.Session.get")
-    def test_rate_limit_error(self, mock_get):
-        """Test rate limit error handling."""
-        # Set up mock response
-        mock_response = MagicMock()
-        mock_response.status_code = 429
-        mock_response.json.return_value = {"error": "Too many requests"}
-        mock_response.text = '{"error": "Too many requests"}'
-        
-        # Set up side effect to raise HTTPError
-        http_error = requests.exceptions.HTTPError()
-        http_error.response = mock_response
-        mock_get.side_effect = http_error
-        
-        # Call the method and check for exception
-        with self.assertRaises(RateLimitError) as context:
-            self.client.get("contacts")
-        
-        self.assertIn("Rate limit exceeded", str(context.exception))
-        self.assertIn("Too many requests", str(context.exception))
-    
-    @patch("requests.Session.get")
-    def test_server_error(self, mock_get):
-        """Test server error handling."""
-        # Set up mock response
-        mock_response = MagicMock()
-        mock_response.status_code = 500
-        mock_response.json.return_value = {"error": "Internal server error"}
-        mock_response.text = '{"error": "Internal server error"}'
-        
-        # Set up side effect to raise HTTPError
-        http_error = requests.exceptions.HTTPError()
-        http_error.response = mock_response
-        mock_get.side_effect = http_error
-        
-        # Call the method and check for exception
-        with self.assertRaises(ServerError) as context:
-            self.client.get("contacts")
-        
-        self.assertIn("Server error 500", str(context.exception))
-        self.assertIn("Internal server error", str(context.exception))
-    
-    @patch("requests.Session.get")
-    def test_network_error(self, mock_get):
-        """Test network error handling."""
-        # Set up side effect to raise ConnectionError
-        mock_get.side_effect = requests.exceptions.ConnectionError("Connection refused")
-        
-        # Call the method and check for exception
-        with self.assertRaises(NetworkError) as context:
-            self.client.get("contacts")
-        
-        self.assertIn("Network error", str(context.exception))
-        self.assertIn("Connection refused", str(context.exception))
-    
-    @patch("requests.Session.get")
-    def test_http_error_with_non_json_response(self, mock_get):
-        """Test HTTP error with non-JSON response."""
-        # Set up mock response
-        mock_response = MagicMock()
-        mock_response.status_code = 400
-        mock_response.json.side_effect = ValueError("Invalid JSON")
-        mock_response.text = "Invalid request"
-        
-        # Set up side effect to raise HTTPError
-        http_error = requests.exceptions.HTTPError()
-        http_error.response = mock_response
-        mock_get.side_effect = http_error
-        
-        # Call the method and check for exception
-        with self.assertRaises(ValidationError) as context:
-            self.client.get("contacts")
-        
-        self.assertIn("Validation error", str(context.exception))
-        self.assertIn("Invalid request", str(context.exception))
-    
-    def test_lazy_loading_contacts(self):
-        """Test lazy loading of contacts API."""
-        with patch("active_trail.client.ContactsAPI") as mock_contacts_api:
-            # First access should initialize the module
-            contacts = self.client.contacts
-            mock_contacts_api.assert_called_once_with(self.client)
-            
-            # Second access should return the cached instance
-            contacts = self.client.contacts
-            # Assert it was only initialized once
-            mock_contacts_api.assert_called_once()
-    
-    def test_lazy_loading_campaigns(self):
-        """Test lazy loading of campaigns API."""
-        with patch("active_trail.client.CampaignsAPI") as mock_campaigns_api:
-            # First access should initialize the module
-            campaigns = self.client.campaigns
-            mock_campaigns_api.assert_called_once_with(self.client)
-            
-            # Second access should return the cached instance
-            campaigns = self.client.campaigns
-            # Assert it was only initialized once
-            mock_campaigns_api.assert_called_once()
-    
-    def test_lazy_loading_messages(self):
-        """Test lazy loading of messages API."""
-        with patch("active_trail.client.MessagesAPI") as mock_messages_api:
-            # First access should initialize the module
-            messages = self.client.messages
-            mock_messages_api.assert_called_once_with(self.client)
-            
-            # Second access should return the cached instance
-            messages = self.client.messages
-            # Assert it was only initialized once
-            mock_messages_api.assert_called_once()
-    
-    def test_lazy_loading_webhooks(self):
-        """Test lazy loading of webhooks API."""
-        with patch("active_trail.client.WebhooksAPI") as mock_webhooks_api:
-            # First access should initialize the module
-            webhooks = self.client.webhooks
-            mock_webhooks_api.assert_called_once_with(self.client)
-            
-            # Second access should return the cached instance
-            webhooks = self.client.webhooks
-            # Assert it was only initialized once
-            mock_webhooks_api.assert_called_once()
-    
-    def test_lazy_loading_sms_campaigns(self):
-        """Test lazy loading of SMS campaigns API."""
-        with patch("active_trail.client.SMSCampaignsAPI") as mock_sms_campaigns_api:
-            # First access should initialize the module
-            sms_campaigns = self.client.sms_campaigns
-            mock_sms_campaigns_api.assert_called_once_with(self.client)
-            
-            # Second access should return the cached instance
-            sms_campaigns = self.client.sms_campaigns
-            # Assert it was only initialized once
-            mock_sms_campaigns_api.assert_called_once()
-    
-    def test_lazy_loading_email_campaigns(self):
-        """Test lazy loading of email campaigns API."""
-        with patch("active_trail.client.EmailCampaignsAPI") as mock_email_campaigns_api:
-            # First access should initialize the module
-            email_campaigns = self.client.email_campaigns
-            mock_email_campaigns_api.assert_called_once_with(self.client)
-            
-            # Second access should return the cached instance
-            email_campaigns = self.client.email_campaigns
-            # Assert it was only initialized once
-            mock_email_campaigns_api.assert_called_once()
-    
-    def test_lazy_loading_operational_messages(self):
-        """Test lazy loading of operational messages API."""
-        with patch("active_trail.client.OperationalMessagesAPI") as mock_operational_messages_api:
-            # First access should initialize the module
-            operational_messages = self.client.operational_messages
-            mock_operational_messages_api.assert_called_once_with(self.client)
-            
-            # Second access should return the cached instance
-            operational_messages = self.client.operational_messages
-            # Assert it was only initialized once
-            mock_operational_messages_api.assert_called_once()
-    
-    def test_lazy_loading_groups(self):
-        """Test lazy loading of groups API."""
-        with patch("active_trail.client.GroupsAPI") as mock_groups_api:
-            # First access should initialize the module
-            groups = self.client.groups
-            mock_groups_api.assert_called_once_with(self.client)
-            
-            # Second access should return the cached instance
-            groups = self.client.groups
-            # Assert it was only initialized once
-            mock_groups_api.assert_called_once()
-    
-    def test_lazy_loading_two_way_sms(self):
-        """Test lazy loading of two-way SMS API."""
-        with patch("active_trail.client.TwoWaySmsAPI") as mock_two_way_sms_api:
-            # First access should initialize the module
-            two_way_sms = self.client.two_way_sms
-            mock_two_way_sms_api.assert_called_once_with(self.client)
-            
-            # Second access should return the cached instance
-            two_way_sms = self.client.two_way_sms
-            # Assert it was only initialized once
-            mock_two_way_sms_api.assert_called_once()
-    
-    def test_lazy_loading_sms_reports(self):
-        """Test lazy loading of SMS reports API."""
-        with patch("active_trail.client.SmsReportsAPI") as mock_sms_reports_api:
-            # First access should initialize the module
-            sms_reports = self.client.sms_reports
-            mock_sms_reports_api.assert_called_once_with(self.client)
-            
-            # Second access should return the cached instance
-            sms_reports = self.client.sms_reports
-            # Assert it was only initialized once
-            mock_sms_reports_api.assert_called_once()
-
-
-if __name__ == "__main__":
-    unittest.main() 
\ No newline at end of file
+# Expected exception class and message fragment per HTTP error status;
+# built once at import and shared by every test_http_error invocation.
+EXPECTED_ERRORS = {
+    400: (ValidationError, "Validation error"),
+    401: (AuthenticationError, "Authentication failed"),
+    404: (NotFoundError, "Resource not found"),
+    429: (RateLimitError, "Rate limit exceeded"),
+    500: (ServerError, "Server error 500"),
+}
+
+
+def test_initialization():
+    """Test client initialization."""
+    client = ActiveTrailClient(api_key=API_KEY, timeout=60)
+
+    assert client.api_key == API_KEY
+    assert client.timeout == 60
+    assert client.BASE_URL == BASE
+    assert client.session.headers["Authorization"] == API_KEY
+    assert client.session.headers["Content-Type"] == "application/json"
+    assert client.session.headers["Accept"] == "application/json"
+
+
+def test_rate_limit_bucket(client):
+    """Test client-side token-bucket rate limiting."""
+    # Disabled by default
+    assert client._bucket is None
+
+    # Enabled when a rate is given; a burst within capacity doesn't block
+    limited = ActiveTrailClient(api_key=API_KEY, rate_limit_rps=100)
+    assert limited._bucket is not None
+    for _ in range(3):
+        limited._bucket.acquire()
+    assert limited._bucket.tokens < 100
+
+
+def test_get_request(client, transport):
+    """Test get method."""
+    transport.set_response(json_body={"data": "test_data"})
+
+    result = client.get("contacts", params={"limit": 10})
+
+    assert result == {"data": "test_data"}
+    assert transport.last_request.method == "GET"
+    assert transport.last_request.url == f"{BASE}contacts?limit=10"
+    assert transport.last_kwargs["timeout"] == 1
+
+
+def test_post_request(client, transport):
+    """Test post method."""
+    transport.set_response(json_body={"id": "123"})
+    payload = {"email": "test@example.com"}
+
+    result = client.post("contacts", json=payload)
+
+    assert result == {"id": "123"}
+    assert transport.last_request.method == "POST"
+    assert transport.last_request.url == f"{BASE}contacts"
+    assert transport.last_request.body == client._encode_body(payload).get(
+        "data", b'{"email": "test@example.com"}'
+    )
+
+
+def test_put_request(client, transport):
+    """Test put method."""
+    transport.set_response(json_body={"id": "123", "updated": True})
+    payload = {"first_name": "John"}
+
+    result = client.put("contacts/123", json=payload)
+
+    assert result == {"id": "123", "updated": True}
+    assert transport.last_request.method == "PUT"
+    assert transport.last_request.url == f"{BASE}contacts/123"
+
+
+def test_delete_request(client, transport):
+    """Test delete method."""
+    transport.set_response(json_body={"success": True})
+
+    result = client.delete("contacts/123")
+
+    assert result == {"success": True}
+    assert transport.last_request.method == "DELETE"
+    assert transport.last_request.url == f"{BASE}contacts/123"
+
+
+def test_non_json_response(client, transport):
+    """Test handling of non-JSON response."""
+    transport.set_response(content=b"Success", headers={"Content-Type": "text/plain"})
+
+    result = client.get("export/123")
+
+    assert result == b"Success"
+
+
+def test_empty_response(client, transport):
+    """Test handling of empty response."""
+    transport.set_response(headers={"Content-Type": "application/json"})
+
+    result = client.get("some-endpoint")
+
+    assert result == b""
+
+
+@pytest.mark.parametrize("status_code, api_error", [
+    (400, "Invalid parameter"),
+    (401, "Invalid API key"),
+    (404, "Resource not found"),
+    (429, "Too many requests"),
+    (500, "Internal server error"),
+])
+def test_http_error(client, transport, status_code, api_error):
+    """Test mapping of HTTP error status codes to SDK exceptions."""
+    exc_cls, msg_fragment = EXPECTED_ERRORS[status_code]
+    transport.set_response(status_code=status_code, json_body={"error": api_error})
+
+    # Call the method and check for exception
+    with pytest.raises(exc_cls) as exc_info:
+        client.get("contacts")
+
+    assert msg_fragment in str(exc_info.value)
+    assert api_error in str(exc_info.value)
+
+
+def test_network_error(client, transport):
+    """Test network error handling."""
+    transport.set_exception(
+        requests.exceptions.ConnectionError("Connection refused")
+    )
+
+    # Call the method and check for exception
+    with pytest.raises(NetworkError) as exc_info:
+        client.get("contacts")
+
+    assert "Network error" in str(exc_info.value)
+    assert "Connection refused" in str(exc_info.value)
+
+
+def test_http_error_with_non_json_response(client, transport):
+    """Test HTTP error with non-JSON response."""
+    # response.json() raises on the non-JSON body, so the error detail
+    # falls back to the response text
+    transport.set_response(status_code=400, content=b"Invalid request")
+
+    # Call the method and check for exception
+    with pytest.raises(ValidationError) as exc_info:
+        client.get("contacts")
+
+    assert "Validation error" in str(exc_info.value)
+    assert "Invalid request" in str(exc_info.value)
+
+
+@pytest.mark.parametrize("attr, cls_path", [
+    ("contacts", "active_trail.client.ContactsAPI"),
+    ("campaigns", "active_trail.client.CampaignsAPI"),
+    ("messages", "active_trail.client.MessagesAPI"),
+    ("webhooks", "active_trail.client.WebhooksAPI"),
+    ("sms_campaigns", "active_trail.client.SMSCampaignsAPI"),
+    ("email_campaigns", "active_trail.client.EmailCampaignsAPI"),
+    ("operational_messages", "active_trail.client.OperationalMessagesAPI"),
+    ("groups", "active_trail.client.GroupsAPI"),
+    ("two_way_sms", "active_trail.client.TwoWaySmsAPI"),
+    ("sms_reports", "active_trail.client.SmsReportsAPI"),
+])
+def test_lazy_loading(client, attr, cls_path):
+    """Test lazy loading of the API modules."""
+    with patch(cls_path) as mock_api:
+        # First access should initialize the module
+        getattr(client, attr)
+        mock_api.assert_called_once_with(client)
+
+        # Second access should return the cached instance
+        getattr(client, attr)
+        # Assert it was only initialized once
+        mock_api.assert_called_once()
@@ -2,107 +2,103 @@
 Tests for the Contacts API module.
 """
 
-import unittest
-from unittest.mock import MagicMock, AsyncMock, patch
+import pytest
 
 from active_trail.contacts import ContactsAPI
 
+NEW_CONTACT = {"email": "new@example.com", "first_name": "Test"}
+UPDATED_CONTACT = {"email": "updated@example.com"}
 
-class TestSyncContactsAPI(unittest.TestCase):
-    """Test cases for the synchronous ContactsAPI."""
-
-    def setUp(self):
-        """Set up test environment."""
-        self.mock_client = MagicMock()
-        self.contacts_api = ContactsAPI(self.mock_client)
-    
-    def test_list(self):
-        """Test getting contacts."""
-        # Setup mock return value
-        expected_result = {"contacts": [{"id": "1", "email": "test@example.com"}]}
-        self.mock_client.get.return_value = expected_result
-        
-        # Call the method
-        result = self.contacts_api.list(params={"limit": 10, "offset": 5})
-        
-        # Verify the client was called correctly
-        self.mock_client.get.assert_called_once_with(
-            "contacts", params={"limit": 10, "offset": 5}
-        )
-        
-        # Verify the result
-        self.assertEqual(result, expected_result)
-    
-    def test_get(self):
-        """Test getting a single contact."""
-        # Setup mock return value
-        expected_result = {"id": "123", "email": "contact@example.com"}
-        self.mock_client.get.return_value = expected_result
-        
-        # Call the method
-        result = self.contacts_api.get("123")
-        
-        # Verify the client was called correctly
-        self.mock_client.get.assert_called_once_with("contacts/123")
-        
-        # Verify the result
-        self.assertEqual(result, expected_result)
-    
-    def test_create(self):
-        """Test creating a contact."""
-        # Setup mock return value
-        expected_result = {"id": "123", "email": "new@example.com"}
-        self.mock_client.post.return_value = expected_result
-        
-        # Contact data
-        contact_data = {"email": "new@example.com", "first_name": "Test"}
-        
-        # Call the method
-        result = self.contacts_api.create(contact_data)
-        
-        # Verify the client was called correctly
-        self.mock_client.post.assert_called_once_with(
-            "contacts", json=contact_data
-        )
-        
-        # Verify the result
-        self.assertEqual(result, expected_result)
-    
-    def test_update(self):
-        """Test updating a contact."""
-        # Setup mock return value
-        expected_result = {"id": "123", "email": "updated@example.com"}
-        self.mock_client.put.return_value = expected_result
-        
-        # Contact data
-        contact_data = {"email": "updated@example.com"}
-        
-        # Call the method
-        result = self.contacts_api.update("123", contact_data)
-        
-        # Verify the client was called correctly
-        self.mock_client.put.assert_called_once_with(
-            "contacts/123", json=contact_data
-        )
-        
-        # Verify the result
-        self.assertEqual(result, expected_result)
-    
-    def test_delete(self):
-        """Test deleting a contact."""
-        # Setup mock return value
-        expected_result = {}
-        self.mock_client.delete.return_value = expected_result
-        
-        # Call the method
-        result = self.contacts_api.delete("123")
-        
-        # Verify the client was called correctly
-        self.mock_client.delete.assert_called_once_with("contacts/123")
-        
-        # Verify the result
-        self.assertEqual(result, expected_result)
-
-
-if __name__ == "__main__":
-    unittest.main() 
\ No newline at end of file
+# (method, args, http_method, expected_url, expected_kwargs) for the
+# single-call CRUD methods; one parametrized test replaces four
+# structurally identical test functions.
+CRUD_CASES = [
+    ("get", ("123",), "get", "contacts/123", {}),
+    ("create", (NEW_CONTACT,), "post", "contacts", {"json": NEW_CONTACT}),
+    ("update", ("123", UPDATED_CONTACT), "put", "contacts/123",
+     {"json": UPDATED_CONTACT}),
+    ("delete", ("123",), "delete", "contacts/123", {}),
+]
+
+
+@pytest.fixture
+def contacts_api(mock_client):
+    """ContactsAPI instance over the mock client."""
+    return ContactsAPI(mock_client)
+
+
+def test_list(contacts_api, mock_client):
+    """Test getting contacts."""
+    # Setup mock return value
+    expected_result = {"contacts": [{"id": "1", "email": "test@example.com"}]}
+    mock_client.get.return_value = expected_result
+
+    # Call the method
+    result = contacts_api.list(params={"limit": 10, "offset": 5})
+
+    # Verify the client was called correctly
+    mock_client.get.assert_called_once_with(
+        "contacts", params={"limit": 10, "offset": 5}
+    )
+    assert result == expected_result
+
+
+@pytest.mark.parametrize(
+    "method, args, http_method, expected_url, expected_kwargs", CRUD_CASES
+)
+def test_crud_methods(contacts_api, mock_client, method, args, http_method,
+                      expected_url, expected_kwargs):
+    """Test the single-call CRUD methods."""
+    expected_result = {"id": "123"}
+    getattr(mock_client, http_method).return_value = expected_result
+
+    result = getattr(contacts_api, method)(*args)
+
+    # Compare call_args directly: plain tuple/dict equality instead of the
+    # _Call normalization that assert_called_once_with goes through
+    mock_method = getattr(mock_client, http_method)
+    assert mock_method.call_count == 1
+    assert mock_method.call_args.args == (expected_url,)
+    assert mock_method.call_args.kwargs == expected_kwargs
+    # The API methods return the client's response unchanged, so identity
+    # holds and the deep-equality walk is unnecessary
+    assert result is expected_result
+
+
+def test_iter_list(contacts_api, mock_client):
+    """Test lazy page-by-page iteration over contacts."""
+    # Two full pages followed by a short final page
+    pages = [
+        {"contacts": [{"id": "1"}, {"id": "2"}]},
+        {"contacts": [{"id": "3"}]}
+    ]
+    mock_client.get.side_effect = pages
+
+    # Drain the iterator
+    contacts = list(contacts_api.iter_list(page_size=2))
+
+    # Verify all contacts yielded in order and both pages fetched
+    assert contacts == [{"id": "1"}, {"id": "2"}, {"id": "3"}]
+    assert mock_client.get.call_count == 2
+
+
+def test_create_many(contacts_api, mock_client):
+    """Test creating multiple contacts in one bulk request."""
+    expected_result = {"created": 2}
+    mock_client.post.return_value = expected_result
+
+    result = contacts_api.create_many([
+        {"email": "first@example.com"},
+        {"email": "second@example.com", "first_name": "Test"}
+    ])
+
+    mock_client.post.assert_called_once_with(
+        "contacts/bulk",
+        json={
+            "contacts": [
+                {"email": "first@example.com"},
+                {"email": "second@example.com", "first_name": "Test"}
+            ]
+        }
+    )
+    assert result == expected_result
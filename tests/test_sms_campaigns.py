@@ -2,11 +2,13 @@
 Tests for the SMS Campaigns API module.
 """
 
+import copy
 import unittest
 from unittest.mock import MagicMock, patch
 from datetime import datetime, timedelta
 from pydantic import ValidationError
 
+from active_trail.client import ActiveTrailClient
 from active_trail.sms_campaigns import SMSCampaignsAPI
 from active_trail.dto.sms_campaigns import (
     SMSCampaignDTO, 
@@ -18,48 +20,82 @@ from active_trail.dto.sms_campaigns import (
     ApiSMSMobileDTO
 )
 
+# Canonical request payloads built once at import and treated as read-only;
+# tests that need a variant copy before mutating (deepcopy where the change
+# touches a nested dict). Rebuilding these literals per test is pure
+# allocation churn.
+TOMORROW = datetime.now() + timedelta(days=1)
+
+CAMPAIGN_DATA = {
+    "name": "Test Campaign",
+    "content": "Test content with a code: TEST123",
+    "unsubscribe_text": "Reply STOP to unsubscribe",
+    "segment": {
+        "group_ids": [123, 456]
+    },
+    "scheduling": {
+        "scheduled_date": TOMORROW.isoformat(),
+        "scheduled_time_zone": "Israel",
+        "is_sent": False
+    },
+    "from_name": "TestBrand",
+    "can_unsubscribe": True,
+    "is_link_tracking": True
+}
+
+OPERATIONAL_MESSAGE_DATA = {
+    "details": {
+        "name": "Test Operational",
+        "content": "Your code is 123456",
+        "from_name": "TestApp"
+    },
+    "scheduling": {
+        "send_now": True
+    },
+    "mobiles": [
+        {"phone_number": "+1234567890"}
+    ]
+}
+
+# Invalid payload variants derived from the templates once at import; the
+# validation-error tests raise on them without per-test copy-and-mutate.
+INVALID_FROM_NAME_CAMPAIGN = {
+    **CAMPAIGN_DATA, "from_name": "Invalid Name with Spaces"
+}
+INVALID_MISSING_REQUIRED_CAMPAIGN = {
+    # Missing content, unsubscribe_text, segment, scheduling
+    "name": "Test Campaign",
+    "from_name": "TestBrand"
+}
+INVALID_PHONE_MESSAGE = {
+    **OPERATIONAL_MESSAGE_DATA, "mobiles": [{"phone_number": "1234567890"}]
+}
+
 
 class TestSMSCampaignsAPI(unittest.TestCase):
     """Test cases for the SMS Campaigns API."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Build the shared mock client and fixture datetime once per class."""
+        # Spec'd against the real client so only its attributes exist;
+        # MagicMock construction dominates per-test setup cost, so the one
+        # instance is shared and recursively reset before each test.
+        cls.mock_client = MagicMock(spec=ActiveTrailClient)
+        cls.sms_campaigns_api = SMSCampaignsAPI(cls.mock_client)
+        cls.tomorrow = TOMORROW
+
     def setUp(self):
         """Set up test environment."""
-        self.mock_client = MagicMock()
-        self.sms_campaigns_api = SMSCampaignsAPI(self.mock_client)
-        
-        # Common test data
-        self.tomorrow = datetime.now() + timedelta(days=1)
-        self.campaign_data = {
-            "name": "Test Campaign",
-            "content": "Test content with a code: TEST123",
-            "unsubscribe_text": "Reply STOP to unsubscribe",
-            "segment": {
-                "group_ids": [123, 456]
-            },
-            "scheduling": {
-                "scheduled_date": self.tomorrow.isoformat(),
-                "scheduled_time_zone": "Israel",
-                "is_sent": False
-            },
-            "from_name": "TestBrand",
-            "can_unsubscribe": True,
-            "is_link_tracking": True
-        }
-        
-        self.operational_message_data = {
-            "details": {
-                "name": "Test Operational",
-                "content": "Your code is 123456",
-                "from_name": "TestApp"
-            },
-            "scheduling": {
-                "send_now": True
-            },
-            "mobiles": [
-                {"phone_number": "+1234567890"}
-            ]
-        }
-    
+        self.mock_client.reset_mock(return_value=True, side_effect=True)
+        # The API instance is shared too; its only per-test state is the
+        # opt-in response cache, which disable_cache resets
+        self.sms_campaigns_api.disable_cache()
+
+        # Shared read-only payload templates; tests copy before mutating
+        self.campaign_data = CAMPAIGN_DATA
+        self.operational_message_data = OPERATIONAL_MESSAGE_DATA
+
     def test_get_campaigns(self):
         """Test getting SMS campaigns."""
         # Setup mock return value
@@ -85,24 +121,48 @@ class TestSMSCampaignsAPI(unittest.TestCase):
             limit=10
         )
         
-        # Verify the client was called correctly
+        # Verify the client was called correctly: snapshot call_args once
+        # and compare the whole params dict in a single equality instead of
+        # re-dereferencing the mock for each key
         self.mock_client.get.assert_called_once()
-        call_args = self.mock_client.get.call_args
-        self.assertEqual(call_args[0][0], "smscampaign/Campaign")
-        
-        # Check params
-        params = call_args[1]["params"]
-        self.assertEqual(params["IsIncludeNotSent"], True)
-        self.assertEqual(params["FromDate"], from_date.isoformat())
-        self.assertEqual(params["ToDate"], to_date.isoformat())
-        self.assertEqual(params["SearchTerm"], "Test")
-        self.assertEqual(params["FilterType"], 1)
-        self.assertEqual(params["Page"], 1)
-        self.assertEqual(params["Limit"], 10)
-        
+        args, kwargs = self.mock_client.get.call_args
+        self.assertEqual(args, ("smscampaign/Campaign",))
+        self.assertEqual(kwargs["params"], {
+            "IsIncludeNotSent": True,
+            "FromDate": from_date.isoformat(),
+            "ToDate": to_date.isoformat(),
+            "SearchTerm": "Test",
+            "FilterType": 1,
+            "Page": 1,
+            "Limit": 10
+        })
+
         # Verify the result
         self.assertEqual(result, expected_result)
     
+    def test_get_all_campaigns(self):
+        """Test fetching all campaigns across multiple pages."""
+        # Three pages of results with two campaigns per page
+        pages = {
+            1: {"sms_campaign": [{"id": 1}, {"id": 2}], "total_items": 5},
+            2: {"sms_campaign": [{"id": 3}, {"id": 4}], "total_items": 5},
+            3: {"sms_campaign": [{"id": 5}], "total_items": 5}
+        }
+        self.mock_client.get.side_effect = (
+            lambda url, params=None, timeout=None: pages[params["Page"]]
+        )
+
+        # Call the method
+        result = self.sms_campaigns_api.get_all_campaigns(page_size=2)
+
+        # All pages were fetched and concatenated in order
+        self.assertEqual(self.mock_client.get.call_count, 3)
+        self.assertEqual(
+            result["sms_campaign"],
+            [{"id": 1}, {"id": 2}, {"id": 3}, {"id": 4}, {"id": 5}]
+        )
+        self.assertEqual(result["total_items"], 5)
+
     def test_get_campaign(self):
         """Test getting a single SMS campaign."""
         # Setup mock return value
@@ -118,11 +178,41 @@ class TestSMSCampaignsAPI(unittest.TestCase):
         result = self.sms_campaigns_api.get_campaign(123)
         
         # Verify the client was called correctly
-        self.mock_client.get.assert_called_once_with("smscampaign/Campaign/123")
+        self.mock_client.get.assert_called_once_with("smscampaign/Campaign/123", timeout=10)
         
         # Verify the result
         self.assertEqual(result, expected_result)
     
+    def test_get_report(self):
+        """Test getting an SMS campaign report."""
+        # Setup mock return value
+        expected_result = {"sent": 100, "delivered": 95, "errors": 5}
+        self.mock_client.get.return_value = expected_result
+
+        # Call the method
+        result = self.sms_campaigns_api.get_report(123)
+
+        # Verify the client was called correctly
+        self.mock_client.get.assert_called_once_with("smscampaignreport/123", timeout=10)
+
+        # Verify the result
+        self.assertEqual(result, expected_result)
+
+    def test_get_report_with_contacts(self):
+        """Test getting an SMS campaign report including delivered contacts."""
+        # Setup mock return value
+        expected_result = {"sent": 100, "delivered_contacts": [{"id": 1}]}
+        self.mock_client.get.return_value = expected_result
+
+        # Call the method
+        result = self.sms_campaigns_api.get_report(123, get_contacts=True)
+
+        # Verify the client was called correctly
+        self.mock_client.get.assert_called_once_with("smscampaignreport/123/Delivered", timeout=10)
+
+        # Verify the result
+        self.assertEqual(result, expected_result)
+
     def test_create_with_dict(self):
         """Test creating an SMS campaign with dictionary input."""
         # Setup mock return value
@@ -191,10 +281,8 @@ class TestSMSCampaignsAPI(unittest.TestCase):
         expected_result = {"id": 123, "name": "Updated Campaign"}
         self.mock_client.put.return_value = expected_result
         
-        # Update data
-        update_data = self.campaign_data.copy()
-        update_data["id"] = 123
-        update_data["name"] = "Updated Campaign"
+        # Update data: one unpack fuses the copy and the overrides
+        update_data = {**self.campaign_data, "id": 123, "name": "Updated Campaign"}
         
         # Call the method
         result = self.sms_campaigns_api.update(update_data)
@@ -209,12 +297,10 @@ class TestSMSCampaignsAPI(unittest.TestCase):
     
     def test_update_missing_id(self):
         """Test updating an SMS campaign without ID raises error."""
-        # Update data without ID
-        update_data = self.campaign_data.copy()  # No ID set
-        
-        # Call the method and expect ValueError
+        # The template carries no ID; update() doesn't mutate its input, so
+        # it can be passed as-is
         with self.assertRaises(ValueError):
-            self.sms_campaigns_api.update(update_data)
+            self.sms_campaigns_api.update(self.campaign_data)
     
     def test_get_estimate(self):
         """Test getting campaign estimate."""
@@ -226,7 +312,7 @@ class TestSMSCampaignsAPI(unittest.TestCase):
         result = self.sms_campaigns_api.get_estimate(123)
         
         # Verify the client was called correctly
-        self.mock_client.get.assert_called_once_with("smscampaign/Campaign/123/estimate")
+        self.mock_client.get.assert_called_once_with("smscampaign/Campaign/123/estimate", timeout=10)
         
         # Verify the result
         self.assertEqual(result, expected_result)
@@ -294,7 +380,7 @@ class TestSMSCampaignsAPI(unittest.TestCase):
         result = self.sms_campaigns_api.get_operational_message(456)
         
         # Verify the client was called correctly
-        self.mock_client.get.assert_called_once_with("smscampaign/OperationalMessage/456")
+        self.mock_client.get.assert_called_once_with("smscampaign/OperationalMessage/456", timeout=10)
         
         # Verify the result
         self.assertEqual(result, expected_result)
@@ -309,8 +395,9 @@ class TestSMSCampaignsAPI(unittest.TestCase):
         }
         self.mock_client.put.return_value = expected_result
         
-        # Update data
-        update_data = self.operational_message_data.copy()
+        # Update data; deepcopy because the change reaches into the nested
+        # details dict of the shared template
+        update_data = copy.deepcopy(self.operational_message_data)
         update_data["details"]["name"] = "Updated Operational"
         update_data["details"]["content"] = "Your updated code is 654321"
         
@@ -325,38 +412,115 @@ class TestSMSCampaignsAPI(unittest.TestCase):
         # Verify the result
         self.assertEqual(result, expected_result)
     
+    def test_response_cache(self):
+        """Test opt-in response cache for read endpoints."""
+        # Setup mock return value
+        expected_result = {"id": 123, "name": "Test Campaign"}
+        self.mock_client.get.return_value = expected_result
+
+        # Caching is disabled by default - two calls hit the client twice
+        self.sms_campaigns_api.get_campaign(123)
+        self.sms_campaigns_api.get_campaign(123)
+        self.assertEqual(self.mock_client.get.call_count, 2)
+
+        # With caching enabled, the repeat read is served from memory
+        self.mock_client.get.reset_mock()
+        self.sms_campaigns_api.enable_cache(ttl_seconds=30)
+        result_first = self.sms_campaigns_api.get_campaign(123)
+        result_second = self.sms_campaigns_api.get_campaign(123)
+        self.assertEqual(self.mock_client.get.call_count, 1)
+        self.assertEqual(result_first, result_second)
+
+        # A write invalidates the cache
+        self.mock_client.post.return_value = {"id": 124}
+        self.sms_campaigns_api.create(self.campaign_data)
+        self.sms_campaigns_api.get_campaign(123)
+        self.assertEqual(self.mock_client.get.call_count, 2)
+
+        # Disabling the cache goes back to hitting the client every time
+        self.sms_campaigns_api.disable_cache()
+        self.sms_campaigns_api.get_campaign(123)
+        self.sms_campaigns_api.get_campaign(123)
+        self.assertEqual(self.mock_client.get.call_count, 4)
+
+    def test_batch_operational_message(self):
+        """Test batching recipients into multi-recipient sends."""
+        # Setup mock return value
+        self.mock_client.post.return_value = {"id": 456}
+
+        details = self.operational_message_data["details"]
+
+        # Three recipients with max_batch=2 should produce two posts
+        with self.sms_campaigns_api.batch_operational_message(details, max_batch=2) as batch:
+            batch.add("+1234567890")
+            batch.add("+1234567891")
+            batch.add("+1234567892")
+
+        self.assertEqual(self.mock_client.post.call_count, 2)
+        self.assertEqual(batch.responses, [{"id": 456}, {"id": 456}])
+
+        # First post carries the full batch, second the remainder
+        first_payload = self.mock_client.post.call_args_list[0][1]["json"]
+        second_payload = self.mock_client.post.call_args_list[1][1]["json"]
+        self.assertEqual(
+            first_payload["mobiles"],
+            [{"phone_number": "+1234567890"}, {"phone_number": "+1234567891"}]
+        )
+        self.assertEqual(second_payload["mobiles"], [{"phone_number": "+1234567892"}])
+
+    def test_send_operational_messages(self):
+        """Test sending several operational messages concurrently."""
+        # Setup mock return value
+        self.mock_client.post.return_value = {"id": 456}
+
+        second_message = {
+            **self.operational_message_data,
+            "mobiles": [{"phone_number": "+9876543210"}]
+        }
+
+        # Call the method
+        results = self.sms_campaigns_api.send_operational_messages(
+            [self.operational_message_data, second_message]
+        )
+
+        # Both messages were posted and responses returned in order
+        self.assertEqual(self.mock_client.post.call_count, 2)
+        self.assertEqual(results, [{"id": 456}, {"id": 456}])
+        for call in self.mock_client.post.call_args_list:
+            self.assertEqual(call[0][0], "smscampaign/OperationalMessage")
+
     def test_validation_error_campaign(self):
         """Test validation error for invalid campaign data."""
-        # Campaign data with invalid from_name
-        invalid_campaign = self.campaign_data.copy()
-        invalid_campaign["from_name"] = "Invalid Name with Spaces"  # Contains spaces
-        
-        # Call the method and expect ValidationError
-        with self.assertRaises(ValidationError):
-            self.sms_campaigns_api.create(invalid_campaign)
-    
+        # from_name contains spaces. Inspect the structured errors()
+        # (without the URL and input echoes, which are expensive to build)
+        # instead of stringifying the whole error tree.
+        with self.assertRaises(ValidationError) as ctx:
+            self.sms_campaigns_api.create(INVALID_FROM_NAME_CAMPAIGN)
+
+        errors = ctx.exception.errors(include_url=False, include_input=False)
+        self.assertEqual(errors[0]["loc"], ("from_name",))
+
     def test_validation_error_missing_required(self):
         """Test validation error for missing required fields."""
-        # Campaign data missing required fields
-        invalid_campaign = {
-            "name": "Test Campaign",
-            # Missing content, unsubscribe_text, segment, scheduling
-            "from_name": "TestBrand"
-        }
-        
-        # Call the method and expect ValidationError
-        with self.assertRaises(ValidationError):
-            self.sms_campaigns_api.create(invalid_campaign)
-    
+        with self.assertRaises(ValidationError) as ctx:
+            self.sms_campaigns_api.create(INVALID_MISSING_REQUIRED_CAMPAIGN)
+
+        # One 'missing' error per absent required field
+        errors = ctx.exception.errors(include_url=False, include_input=False)
+        self.assertEqual(
+            [error["loc"] for error in errors],
+            [("content",), ("unsubscribe_text",), ("segment",), ("scheduling",)]
+        )
+
     def test_validation_error_phone_number(self):
         """Test validation error for invalid phone number."""
-        # Message with invalid phone number
-        invalid_message = self.operational_message_data.copy()
-        invalid_message["mobiles"] = [{"phone_number": "1234567890"}]  # Missing + prefix
-        
-        # Call the method and expect ValidationError
-        with self.assertRaises(ValidationError):
-            self.sms_campaigns_api.send_operational_message(invalid_message)
+        # Phone number missing the + prefix; raised by the model-level
+        # validator, so the loc is the model itself
+        with self.assertRaises(ValidationError) as ctx:
+            self.sms_campaigns_api.send_operational_message(INVALID_PHONE_MESSAGE)
+
+        errors = ctx.exception.errors(include_url=False, include_input=False)
+        self.assertEqual(errors[0]["loc"], ())
     
     def test_validate_and_convert_type_error(self):
         """Test _validate_and_convert with wrong input type."""
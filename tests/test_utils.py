@@ -4,7 +4,12 @@ Tests for utility functions.
 
 import unittest
 import logging
-from active_trail.utils import validate_email, prepare_contact_payload
+from active_trail.utils import (
+    validate_email,
+    validate_emails_bulk,
+    prepare_contact_payload,
+    prepare_contact_payloads_bulk
+)
 
 
 class TestUtils(unittest.TestCase):
@@ -24,6 +29,15 @@ class TestUtils(unittest.TestCase):
         self.assertFalse(validate_email("user@.com"))
         self.assertFalse(validate_email("user@domain."))
         
+    def test_validate_emails_bulk(self):
+        """Test bulk email validation."""
+        results = validate_emails_bulk([
+            "test@example.com",
+            "not_an_email",
+            "user@domain."
+        ])
+        self.assertEqual(results, [True, False, False])
+
     def test_prepare_contact_payload(self):
         """Test contact payload preparation with Israeli phone number validation."""
         # Basic payload with email only (no phone validation)
@@ -77,6 +91,37 @@ class TestUtils(unittest.TestCase):
         with self.assertRaises(ValueError):
             prepare_contact_payload("valid@example.com", phone="1234567890")  # Non-Israeli format
 
+        # Test with custom_fields that isn't a dict
+        with self.assertRaises(TypeError):
+            prepare_contact_payload("valid@example.com", custom_fields=["not", "a", "dict"])
+
+    def test_prepare_contact_payloads_bulk(self):
+        """Test bulk contact payload preparation."""
+        payloads = prepare_contact_payloads_bulk([
+            {"email": "first@example.com"},
+            {
+                "email": "second@example.com",
+                "first_name": "Jane",
+                "phone": "0512345678"
+            }
+        ])
+
+        self.assertEqual(payloads, [
+            {"email": "first@example.com"},
+            {
+                "email": "second@example.com",
+                "first_name": "Jane",
+                "phone": "0512345678"
+            }
+        ])
+
+        # A single invalid contact fails the whole batch
+        with self.assertRaises(ValueError):
+            prepare_contact_payloads_bulk([
+                {"email": "valid@example.com"},
+                {"email": "not_an_email"}
+            ])
+
 
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file
@@ -0,0 +1,86 @@
+"""
+Tests for the Webhooks API.
+"""
+
+import unittest
+from unittest.mock import MagicMock
+
+from active_trail.webhooks import WebhooksAPI
+
+
+class TestWebhooksAPI(unittest.TestCase):
+    """Test cases for the WebhooksAPI class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.mock_client = MagicMock()
+        self.webhooks_api = WebhooksAPI(self.mock_client)
+
+    def test_list(self):
+        """Test listing webhooks."""
+        expected_result = {"webhooks": [{"id": 1}, {"id": 2}]}
+        self.mock_client.request.return_value = expected_result
+
+        result = self.webhooks_api.list(limit=10)
+
+        self.mock_client.request.assert_called_once_with(
+            "GET", "webhooks", params={"limit": 10}
+        )
+        self.assertEqual(result, expected_result)
+
+    def test_get(self):
+        """Test getting a single webhook."""
+        expected_result = {"id": 123, "url": "https://example.com/hook"}
+        self.mock_client.request.return_value = expected_result
+
+        result = self.webhooks_api.get(123)
+
+        self.mock_client.request.assert_called_once_with("GET", "webhooks/123")
+        self.assertEqual(result, expected_result)
+
+    def test_create(self):
+        """Test registering a webhook."""
+        expected_result = {"id": 123, "url": "https://example.com/hook"}
+        self.mock_client.request.return_value = expected_result
+
+        result = self.webhooks_api.create(
+            "https://example.com/hook",
+            events=["contact.created"],
+            is_active=True
+        )
+
+        self.mock_client.request.assert_called_once_with(
+            "POST",
+            "webhooks",
+            data={
+                "url": "https://example.com/hook",
+                "events": ["contact.created"],
+                "is_active": True
+            }
+        )
+        self.assertEqual(result, expected_result)
+
+    def test_update(self):
+        """Test updating a webhook."""
+        expected_result = {"id": 123, "is_active": False}
+        self.mock_client.request.return_value = expected_result
+
+        result = self.webhooks_api.update(123, is_active=False)
+
+        self.mock_client.request.assert_called_once_with(
+            "PUT", "webhooks/123", data={"is_active": False}
+        )
+        self.assertEqual(result, expected_result)
+
+    def test_delete(self):
+        """Test deleting a webhook."""
+        self.mock_client.request.return_value = {}
+
+        result = self.webhooks_api.delete(123)
+
+        self.mock_client.request.assert_called_once_with("DELETE", "webhooks/123")
+        self.assertEqual(result, {})
+
+
+if __name__ == "__main__":
+    unittest.main()